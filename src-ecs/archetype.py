@@ -0,0 +1,70 @@
+from typing import Type, TYPE_CHECKING
+
+from ecs_types import EntityId, Component
+
+if TYPE_CHECKING:
+    from query import Query
+
+
+class Archetype:
+    """
+    Хранилище сущностей с одинаковым набором компонентов (сигнатурой).
+    Компоненты лежат по столбцам: columns[класс][i] принадлежит сущности entities[i]
+    """
+
+    __slots__ = ('signature', 'entities', 'rows', 'columns', 'add_edges', 'remove_edges', 'queries')
+
+    def __init__(self, signature: frozenset[Type[Component]]):
+        self.signature = signature
+        self.entities: list[EntityId] = []
+        self.rows: dict[EntityId, int] = {}
+        self.columns: dict[Type[Component], list[Component]] = {
+            component_class: [] for component_class in signature
+        }
+        # Кэш переходов в соседние архетипы при добавлении/удалении одного компонента
+        self.add_edges: dict[Type[Component], 'Archetype'] = {}
+        self.remove_edges: dict[Type[Component], 'Archetype'] = {}
+        # Зарегистрированные запросы, в которые попадает этот архетип
+        self.queries: list['Query'] = []
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def append(self, entity_id: EntityId, components: dict[Type[Component], Component]) -> None:
+        """
+        Добавляет сущность в конец таблицы. components обязан содержать ровно классы сигнатуры
+        """
+        self.rows[entity_id] = len(self.entities)
+        self.entities.append(entity_id)
+        for component_class, column in self.columns.items():
+            column.append(components[component_class])
+        for query in self.queries:
+            query.version += 1
+
+    def pop(self, entity_id: EntityId) -> dict[Type[Component], Component]:
+        """
+        Убирает сущность из таблицы за O(1): на её место переезжает последняя строка.
+        Возвращает компоненты убранной сущности
+        """
+        row = self.rows.pop(entity_id)
+        last_entity = self.entities.pop()
+        components = {}
+        for component_class, column in self.columns.items():
+            last_component = column.pop()
+            if last_entity == entity_id:
+                components[component_class] = last_component
+            else:
+                components[component_class] = column[row]
+                column[row] = last_component
+        if last_entity != entity_id:
+            self.entities[row] = last_entity
+            self.rows[last_entity] = row
+        for query in self.queries:
+            query.version += 1
+        return components
+
+    def get(self, entity_id: EntityId, component_class: Type[Component]) -> Component:
+        """
+        Кидает KeyError если сущности нет в архетипе или у архетипа нет такого компонента
+        """
+        return self.columns[component_class][self.rows[entity_id]]
@@ -0,0 +1,93 @@
+import json
+import os
+import struct
+from pathlib import Path
+
+import pygame
+
+from atlas import TextureAtlas
+
+# Формат файла: MAGIC, длина метаданных (uint32 LE), метаданные в JSON,
+# затем пиксели страниц атласа подряд (RGBA, построчно, без выравнивания)
+MAGIC = b'PGAC'
+VERSION = 1
+
+
+def source_stamp(path: Path) -> list[int] | None:
+    """Отпечаток исходного файла: (mtime_ns, размер); None, если файла нет"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def save(cache_path: Path, atlas: TextureAtlas, sources: dict[str, Path]) -> None:
+    """Записывает атлас и отпечатки его исходников (имя в атласе -> файл) в один файл"""
+    meta = {
+        'version': VERSION,
+        'sources': {name: [str(sources[name]), source_stamp(sources[name])] for name in atlas.index},
+        'pages': [list(page.get_size()) for page in atlas.pages],
+        'index': {name: [page, *rect] for name, (page, rect) in atlas.index.items()},
+    }
+    meta_bytes = json.dumps(meta).encode('utf-8')
+
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix('.tmp')
+    with tmp_path.open('wb') as file:
+        file.write(MAGIC)
+        file.write(struct.pack('<I', len(meta_bytes)))
+        file.write(meta_bytes)
+        for page in atlas.pages:
+            file.write(pygame.image.tobytes(page, 'RGBA'))
+    # Подмена одним действием: недописанный файл никогда не окажется на месте кэша
+    os.replace(tmp_path, cache_path)
+
+
+def load(cache_path: Path, required: list[str]) -> TextureAtlas | None:
+    """Читает атлас из кэша одним чтением файла.
+    None, если кэша нет, он повреждён, в нём нет какого-то из имён required
+    или какой-то исходник изменился после записи кэша"""
+    try:
+        data = Path(cache_path).read_bytes()
+    except OSError:
+        return None
+    if len(data) < 8 or data[:4] != MAGIC:
+        return None
+    # Повреждённые метаданные (не тот JSON, не хватает полей, неверные типы)
+    # означают то же, что и отсутствие кэша
+    try:
+        (meta_size,) = struct.unpack_from('<I', data, 4)
+        offset = 8 + meta_size
+        meta = json.loads(data[8:offset])
+        if not isinstance(meta, dict) or meta.get('version') != VERSION:
+            return None
+
+        cached_sources = meta['sources']
+        if any(name not in cached_sources for name in required):
+            return None
+        for path, stamp in cached_sources.values():
+            if source_stamp(Path(path)) != stamp:
+                return None
+
+        page_sizes = [(int(width), int(height)) for width, height in meta['pages']]
+        index = {name: (int(page), pygame.Rect(x, y, w, h)) for name, (page, x, y, w, h) in meta['index'].items()}
+    except (KeyError, TypeError, ValueError, struct.error):
+        return None
+
+    view = memoryview(data)
+    pages = []
+    for width, height in page_sizes:
+        size = width * height * 4
+        if width <= 0 or height <= 0 or offset + size > len(data):
+            return None
+        page = pygame.image.frombuffer(view[offset:offset + size], (width, height), 'RGBA')
+        # convert_alpha копирует пиксели в формат экрана; без окна страница остаётся
+        # поверх буфера файла
+        pages.append(page.convert_alpha() if pygame.display.get_surface() is not None else page)
+        offset += size
+
+    if any(not 0 <= page < len(pages) or not pages[page].get_rect().contains(rect) for page, rect in index.values()):
+        return None
+    return TextureAtlas(pages, index)
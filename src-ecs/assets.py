@@ -1,10 +1,14 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+import io
 import pygame
 import random
 from typing import Dict, List, Tuple
 import os
 from settings import GameSettings, TileMap
+from atlas import TextureAtlas
+import asset_cache
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -23,14 +27,87 @@ CHUNK_TEMPLATES = {
     "chunk_template_0": ("Map/chunk_templates", "0"),
     "chunk_template_1": ("Map/chunk_templates", "1")
 }
+# Спрайты, которые загружаются заранее (Game.__init__), а не при первом get_sprite во время игры
+PRELOAD_SPRITES = [
+    *TileMap.FLOOR_TILES,
+    *[f'Player/idle/idle_{i}.png' for i in range(4)],
+    *[f'Enemies/Vampire/vampire_idle_{i}.png' for i in range(3)],
+    *[f'Enemies/Skull/skull_{i}.png' for i in range(4)],
+    *[f'Enemies/Wizard/Wizard{i}.png' for i in range(4)],
+    *[f'Effects/teleport/teleport_{i}.png' for i in range(1, 10)],
+    'items/flask.png',
+    'Items/bomb.png',
+    'Items/coin_1.png',
+    'Items/cookie.png',
+]
+# Потоки фоновой загрузки: чтение файлов и декодирование PNG
+LOADER_THREADS = 4
+
+# Заглушки по размеру тайла: одна поверхность на размер на весь процесс
+_PLACEHOLDERS: Dict[int, pygame.Surface] = {}
+# Файлы, которые не удалось загрузить. Общий для всех AssetManager: повторно с диска
+# они не читаются, сразу отдаётся заглушка
+_MISSING: set[Path] = set()
+
+
+def placeholder(size: int) -> pygame.Surface:
+    """Тайл-заглушка size x size; создаётся один раз на размер.
+    Поверхность общая — рисовать на ней нельзя"""
+    surf = _PLACEHOLDERS.get(size)
+    if surf is None:
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        surf.fill((255, 0, 255, 128))
+        pygame.draw.rect(surf, (0, 0, 0), (0, 0, size, size), 1)
+        _PLACEHOLDERS[size] = surf
+    return surf
+
+
+def _decode_image(path: Path) -> pygame.Surface:
+    """Читает и декодирует изображение в рабочем потоке.
+    convert_alpha сюда не входит: его можно вызывать только на главном потоке"""
+    with open(path, 'rb') as file:
+        data = file.read()
+    return pygame.image.load(io.BytesIO(data), path.name)
+
+
+class LoadJob:
+    """Набор спрайтов, загружаемых в фоне (AssetManager.load_async).
+    Готовность отслеживается по кэшу спрайтов, который пополняет AssetManager.poll()"""
+
+    def __init__(self, assets: "AssetManager", sprite_paths: List[str]):
+        self._assets = assets
+        self.sprite_paths = list(dict.fromkeys(sprite_paths))
+        self.total = len(self.sprite_paths)
+
+    @property
+    def loaded(self) -> int:
+        cache = self._assets.sprite_cache
+        return sum(1 for sprite_path in self.sprite_paths if sprite_path in cache)
+
+    @property
+    def progress(self) -> float:
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return self.loaded == self.total
+
+    def wait(self) -> None:
+        """Дожидается всех спрайтов набора, блокируя главный поток"""
+        for sprite_path in self.sprite_paths:
+            self._assets.get_sprite(sprite_path)
 
 
 @dataclass
 class AssetManager:
-    """Централизованное управление игровыми ресурсами"""
+    """Централизованное управление игровыми ресурсами.
+    Один экземпляр на процесс — Game.assets; сцены берут его через self.app.assets,
+    поэтому при смене уровня уже загруженные поверхности переиспользуются"""
     base_path: Path = GameSettings.BASE_DIR / 'data' / 'images'
     tile_size: int = 16
     template_size: int = 16
+    # Файл кэша атласа (asset_cache); None — без кэша на диске
+    cache_path: Path | None = None
 
     tiles: Dict[str, List[pygame.Surface]] = field(default_factory=dict)
     tile_sprites: Dict[str, pygame.Surface] = field(default_factory=dict)
@@ -38,6 +115,12 @@ class AssetManager:
     chunks: Dict[str, pygame.Surface] = field(default_factory=dict)
     colors: Dict[str, Tuple[int, int, int, int]] = field(default_factory=dict)
 
+    # Спрайты, которые декодируются в фоне, но ещё не переданы в sprite_cache
+    _pending: Dict[str, Future] = field(default_factory=dict, repr=False)
+    _executor: ThreadPoolExecutor | None = field(default=None, repr=False)
+    # Атлас загруженных спрайтов и тайлов (см. pack_atlas)
+    atlas: TextureAtlas | None = field(default=None, repr=False)
+
     def __post_init__(self):
         self._load_assets()
 
@@ -45,7 +128,9 @@ class AssetManager:
         """Загружает все ресурсы при инициализации"""
         self._load_tiles()
         self._load_colors()
-        self._load_tile_sprites()
+        # Из кэша на диске берутся и тайлы, и спрайты PRELOAD_SPRITES
+        if self.cache_path is None or not self.load_cache():
+            self._load_tile_sprites()
 
     def _load_tiles(self):
         """Автоматическая загрузка тайлов из папок"""
@@ -77,23 +162,35 @@ class AssetManager:
             if pattern in f.name
         ]
 
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(LOADER_THREADS, thread_name_prefix='assets')
+        return self._executor
+
+    def _convert(self, path: Path, future: Future) -> pygame.Surface:
+        """Завершает фоновую загрузку на главном потоке"""
+        try:
+            return future.result().convert_alpha()
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading {path}: {e}")
+            _MISSING.add(path)
+            return self._placeholder()
+
     def _load_image(self, path: Path) -> pygame.Surface:
         """Безопасная загрузка изображения"""
+        if path in _MISSING:
+            return self._placeholder()
         try:
             img = pygame.image.load(str(path)).convert_alpha()
             return img
         except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading {path}: {e}")
-            return self._create_placeholder()
+            _MISSING.add(path)
+            return self._placeholder()
 
-    def _create_placeholder(self) -> pygame.Surface:
-        """Создает тайл-заглушку"""
-        surf = pygame.Surface(
-            (self.tile_size, self.tile_size), pygame.SRCALPHA)
-        surf.fill((255, 0, 255, 128))
-        pygame.draw.rect(
-            surf, (0, 0, 0), (0, 0, self.tile_size, self.tile_size), 1)
-        return surf
+    def _placeholder(self) -> pygame.Surface:
+        """Тайл-заглушка размера tile_size"""
+        return placeholder(self.tile_size)
 
     def _load_colors(self):
         """Загружает цветовую палитру"""
@@ -110,17 +207,21 @@ class AssetManager:
         """Загружает спрайты тайлов для карты"""
         for variant, path in TileMap.TILE_VARIANTS.items():
             full_path = self.base_path / path
+            if full_path in _MISSING:
+                self.tile_sprites[variant] = self._placeholder()
+                continue
             try:
                 sprite = pygame.image.load(str(full_path)).convert_alpha()
                 self.tile_sprites[variant] = sprite
-            except pygame.error as e:
+            except (pygame.error, FileNotFoundError) as e:
                 print(f"Couldn't load tile sprite {path}: {e}")
-                sprite = self._create_placeholder()
-                self.tile_sprites[variant] = sprite
+                _MISSING.add(full_path)
+                self.tile_sprites[variant] = self._placeholder()
 
     def get_tile_sprite(self, variant: str) -> pygame.Surface:
         """Получает спрайт тайла по его варианту"""
-        return self.tile_sprites.get(variant, self._create_placeholder())
+        sprite = self.tile_sprites.get(variant)
+        return sprite if sprite is not None else self._placeholder()
 
     def get_chunk(self, chunk_type: str) -> pygame.Surface:
         """Возвращает чанк указанного типа"""
@@ -128,24 +229,135 @@ class AssetManager:
 
     def get_random_chunk(self, chunk_type: str) -> pygame.Surface:
         """Возвращает случайный чанк указанного типа"""
-        return random.choice(self.chunks.get(chunk_type, [self._create_placeholder()]))
+        chunks = self.chunks.get(chunk_type)
+        return random.choice(chunks) if chunks else self._placeholder()
 
     def get_random_tile(self, tile_type: str) -> pygame.Surface:
         """Возвращает случайный тайл указанного типа"""
-        return random.choice(self.tiles.get(tile_type, [self._create_placeholder()]))
+        tiles = self.tiles.get(tile_type)
+        return random.choice(tiles) if tiles else self._placeholder()
 
     def get_tile(self, tile_type: str) -> pygame.Surface:
         """Returns a specific tile of the given type"""
-        return next((tile for tile in self.tiles.get(tile_type, []) if tile), self._create_placeholder())
+        tile = next((tile for tile in self.tiles.get(tile_type, ()) if tile), None)
+        return tile if tile is not None else self._placeholder()
 
     def get_color(self, color_name: str) -> Tuple[int, int, int, int]:
         """Возвращает цвет по имени"""
         return self.colors.get(color_name, (0, 0, 0, 255))
 
+    def preload(self, sprite_paths: List[str] = PRELOAD_SPRITES) -> None:
+        """Загружает спрайты по списку в кэш заранее"""
+        self.load_async(sprite_paths).wait()
+
+    def load_async(self, sprite_paths: List[str] = PRELOAD_SPRITES) -> LoadJob:
+        """Ставит спрайты в фоновую загрузку и сразу возвращает LoadJob для отслеживания.
+        Уже загруженные и уже загружаемые спрайты повторно не читаются, а файлы,
+        которые раньше не загрузились, сразу получают заглушку"""
+        for sprite_path in sprite_paths:
+            if sprite_path in self.sprite_cache or sprite_path in self._pending:
+                continue
+            path = self.base_path / sprite_path
+            if path in _MISSING:
+                self.sprite_cache[sprite_path] = self._placeholder()
+            else:
+                self._pending[sprite_path] = self._pool().submit(_decode_image, path)
+        return LoadJob(self, sprite_paths)
+
+    def poll(self) -> None:
+        """Переносит в кэш спрайты, декодированные в фоне. Вызывается раз в кадр на главном потоке"""
+        if not self._pending:
+            return
+        for sprite_path in [path for path, future in self._pending.items() if future.done()]:
+            self._finish(sprite_path)
+
+    def _finish(self, sprite_path: str) -> pygame.Surface:
+        sprite = self._convert(self.base_path / sprite_path, self._pending.pop(sprite_path))
+        self.sprite_cache[sprite_path] = sprite
+        return sprite
+
+    def _atlas_images(self) -> Dict[str, pygame.Surface]:
+        """Всё, что кладётся в атлас, по именам 'tile:<вариант>' и 'sprite:<путь>'.
+        Шаблоны карт (полные пути) в атлас не попадают"""
+        images = {f'tile:{variant}': sprite for variant, sprite in self.tile_sprites.items()}
+        images.update({f'sprite:{sprite_path}': sprite for sprite_path, sprite in self.sprite_cache.items()
+                       if not Path(sprite_path).is_absolute()})
+        return images
+
+    def _atlas_source(self, name: str) -> Path:
+        kind, key = name.split(':', 1)
+        return self.base_path / (TileMap.TILE_VARIANTS[key] if kind == 'tile' else key)
+
+    def _use_atlas(self, atlas: TextureAtlas) -> None:
+        """Подменяет спрайты и тайлы в кэшах подповерхностями атласа"""
+        self.atlas = atlas
+        for name in atlas.index:
+            kind, key = name.split(':', 1)
+            cache = self.tile_sprites if kind == 'tile' else self.sprite_cache
+            cache[key] = atlas.get(name)
+
+    def pack_atlas(self) -> TextureAtlas:
+        """Упаковывает все загруженные спрайты и тайлы в атлас; get_sprite и get_tile_sprite
+        дальше отдают его подповерхности. Спрайты, загруженные позже, остаются
+        отдельными поверхностями до следующей упаковки"""
+        self._use_atlas(TextureAtlas.build(self._atlas_images()))
+        return self.atlas
+
+    def update_atlas(self) -> None:
+        """Перепаковывает атлас, если появились спрайты вне него, и обновляет кэш на диске"""
+        if self.atlas is not None and all(name in self.atlas for name in self._atlas_images()):
+            return
+        self.pack_atlas()
+        if self.cache_path is not None:
+            self.save_cache()
+
+    def save_cache(self) -> None:
+        """Записывает атлас в cache_path вместе с отпечатками исходных PNG"""
+        if self.atlas is None or self.cache_path is None:
+            return
+        sources = {name: self._atlas_source(name) for name in self.atlas.index}
+        try:
+            asset_cache.save(self.cache_path, self.atlas, sources)
+        except OSError as e:
+            print(f"Couldn't write asset cache {self.cache_path}: {e}")
+
+    def load_cache(self, sprite_paths: List[str] = PRELOAD_SPRITES) -> bool:
+        """Берёт тайлы и спрайты sprite_paths из кэша на диске.
+        False — кэша нет, он неполон или какой-то PNG изменился; тогда грузить нужно из PNG"""
+        if self.cache_path is None:
+            return False
+        required = [f'tile:{variant}' for variant in TileMap.TILE_VARIANTS]
+        required += [f'sprite:{sprite_path}' for sprite_path in sprite_paths]
+        atlas = asset_cache.load(self.cache_path, required)
+        if atlas is None:
+            return False
+        self._use_atlas(atlas)
+        return True
+
+    def get_template(self, template_path: str) -> pygame.Surface:
+        """Шаблон карты по полному пути (можно заранее поставить в load_async).
+        Если файла нет, исключение пробрасывается, а не заменяется заглушкой"""
+        if Path(template_path) in _MISSING:
+            # Фоновая загрузка не удалась, и poll положил в кэш заглушку: уровень
+            # не должен строиться по ней, поэтому повторяем загрузку, чтобы получить
+            # исходную ошибку
+            self.sprite_cache.pop(template_path, None)
+            return pygame.image.load(template_path)
+        if template_path in self.sprite_cache:
+            return self.sprite_cache[template_path]
+        future = self._pending.pop(template_path, None)
+        template = future.result() if future is not None else pygame.image.load(template_path)
+        template = template.convert_alpha()
+        self.sprite_cache[template_path] = template
+        return template
+
     def get_sprite(self, sprite_path: str) -> pygame.Surface:
         """Возвращает спрайт по пути, используя кэш"""
         if sprite_path in self.sprite_cache:
             return self.sprite_cache[sprite_path]
+        if sprite_path in self._pending:
+            # Уже декодируется в фоне — дожидаемся, а не читаем файл второй раз
+            return self._finish(sprite_path)
 
         path = self.base_path / sprite_path
         sprite = self._load_image(path)
@@ -0,0 +1,75 @@
+import pygame
+
+
+class TextureAtlas:
+    """Текстурный атлас: мелкие спрайты упакованы в несколько больших поверхностей (страниц).
+
+    index хранит для каждого имени номер страницы и прямоугольник на ней; get(name)
+    отдаёт подповерхность страницы, которая рисуется как обычный спрайт, но не держит
+    отдельный буфер пикселей. Упаковка полками: спрайты по убыванию высоты
+    выкладываются в ряд, пока хватает ширины страницы.
+    """
+
+    PAGE_SIZE = 512
+
+    def __init__(self, pages: list[pygame.Surface], index: dict[str, tuple[int, pygame.Rect]]):
+        self.pages = pages
+        self.index = index
+        self._subsurfaces: dict[str, pygame.Surface] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get(self, name: str) -> pygame.Surface:
+        sprite = self._subsurfaces.get(name)
+        if sprite is None:
+            page, rect = self.index[name]
+            sprite = self.pages[page].subsurface(rect)
+            self._subsurfaces[name] = sprite
+        return sprite
+
+    @classmethod
+    def build(cls, images: dict[str, pygame.Surface], page_size: int = PAGE_SIZE) -> "TextureAtlas":
+        """Упаковывает изображения в страницы page_size x page_size.
+        Изображения больше страницы в атлас не попадают"""
+        index = cls._layout(images, page_size)
+
+        page_heights: dict[int, int] = {}
+        for page, rect in index.values():
+            page_heights[page] = max(page_heights.get(page, 0), rect.bottom)
+        pages = []
+        for page in range(len(page_heights)):
+            surface = pygame.Surface((page_size, page_heights[page]), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            surface.fill((0, 0, 0, 0))
+            pages.append(surface)
+
+        for name, (page, rect) in index.items():
+            # Спрайты не перекрываются, а страница прозрачна: MAX копирует пиксели вместе
+            # с альфой как есть, без смешивания с фоном
+            pages[page].blit(images[name], rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return cls(pages, index)
+
+    @staticmethod
+    def _layout(images: dict[str, pygame.Surface], page_size: int) -> dict[str, tuple[int, pygame.Rect]]:
+        index = {}
+        page, x, y, shelf_height = 0, 0, 0, 0
+        order = sorted(images, key=lambda name: (images[name].get_height(), images[name].get_width()), reverse=True)
+        for name in order:
+            width, height = images[name].get_size()
+            if width > page_size or height > page_size:
+                continue
+            if x + width > page_size:
+                # Новая полка
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if y + height > page_size:
+                # Новая страница
+                page, x, y, shelf_height = page + 1, 0, 0, 0
+            index[name] = (page, pygame.Rect(x, y, width, height))
+            x += width
+            shelf_height = max(shelf_height, height)
+        return index
@@ -0,0 +1,99 @@
+from itertools import product
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него варианты считаются поклеточно
+    np = None
+
+# Биты соседей в маске: по часовой стрелке, начиная с верхнего
+N, NE, E, SE, S, SW, W, NW = (1 << i for i in range(8))
+NEIGHBOUR_OFFSETS = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)]
+
+# Варианты стен (ключи settings.TileMap.TILE_VARIANTS); код 0 — вариант не определён (None)
+VARIANTS = [None, 'top_left_corner', 'top_right_corner', 'bottom_left_corner', 'bottom_right_corner',
+            'top', 'bottom', 'left', 'right']
+VARIANT_CODES = {variant: code for code, variant in enumerate(VARIANTS)}
+
+
+def resolve_variant(floor_mask: int, wall_mask: int) -> Optional[str]:
+    """Вариант стены по маскам соседей: floor_mask — проходимые соседи, wall_mask — стены.
+    Сосед, которого нет ни в одной маске, пустой. Правила идут по приоритету, сначала углы"""
+    def floor(bits):
+        return floor_mask & bits == bits
+
+    def wall(bits):
+        return wall_mask & bits == bits
+
+    def solid(bit):
+        return (floor_mask | wall_mask) & bit != 0
+
+    if floor(N | NE | E) and wall(W | S):
+        return 'top_left_corner'
+    if wall(E | S) and floor(SE):
+        return 'left'
+    if wall(W | S) and floor(SW):
+        return 'right'
+    if wall(N | W) and floor(NW):
+        return 'bottom_right_corner'
+    if wall(N | E) and floor(NE):
+        return 'bottom_left_corner'
+    if floor(N | NW | W) and wall(S | E):
+        return 'top_right_corner'
+
+    if floor(S):
+        return 'top'
+    if floor(N):
+        return 'bottom'
+    if not floor(W) and solid(E):
+        return 'left'
+    if not floor(E) and solid(W):
+        return 'right'
+    return None
+
+
+def _build_lut() -> bytearray:
+    """Таблица вариантов по ключу floor_mask | wall_mask << 8 для всех 3^8 окружений"""
+    lut = bytearray(1 << 16)
+    for cells in product((0, 1, 2), repeat=8):  # 0 — пусто, 1 — пол, 2 — стена
+        floor_mask = sum(1 << i for i, cell in enumerate(cells) if cell == 1)
+        wall_mask = sum(1 << i for i, cell in enumerate(cells) if cell == 2)
+        lut[floor_mask | wall_mask << 8] = VARIANT_CODES[resolve_variant(floor_mask, wall_mask)]
+    return lut
+
+
+VARIANT_LUT = _build_lut()
+
+
+def _neighbour_mask(cells, width: int, height: int, x: int, y: int) -> int:
+    mask = 0
+    for bit, (dx, dy) in enumerate(NEIGHBOUR_OFFSETS):
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < width and 0 <= ny < height and cells[ny * width + nx]:
+            mask |= 1 << bit
+    return mask
+
+
+def wall_variant(x: int, y: int, is_floor, is_wall, width: int, height: int) -> Optional[str]:
+    """Вариант одной стены; is_floor/is_wall — плоские массивы флагов с индексом y * width + x"""
+    key = (_neighbour_mask(is_floor, width, height, x, y)
+           | _neighbour_mask(is_wall, width, height, x, y) << 8)
+    return VARIANTS[VARIANT_LUT[key]]
+
+
+def wall_variants(is_floor, is_wall):
+    """Коды VARIANTS для всей карты разом: маски соседей собираются сдвигами
+    массивов формы (height, width), вариант — одно обращение к таблице на клетку.
+    Для клеток, которые не стены, возвращается 0. Требует NumPy"""
+    height, width = is_wall.shape
+    floor_padded = np.pad(is_floor, 1)
+    wall_padded = np.pad(is_wall, 1)
+    keys = np.zeros((height, width), dtype=np.uint16)
+    for bit, (dx, dy) in enumerate(NEIGHBOUR_OFFSETS):
+        rows = slice(1 + dy, 1 + dy + height)
+        cols = slice(1 + dx, 1 + dx + width)
+        keys |= floor_padded[rows, cols].astype(np.uint16) << bit
+        keys |= wall_padded[rows, cols].astype(np.uint16) << (bit + 8)
+    variants = np.frombuffer(VARIANT_LUT, dtype=np.uint8)[keys]
+    variants[~is_wall] = 0
+    return variants
@@ -0,0 +1,49 @@
+import pygame
+
+
+class Camera:
+    """Камера: видимая часть мира (в пикселях мира) размером с экран отрисовки.
+
+    Хранится в ECS как переменная 'camera'. Координаты x, y — левый верхний угол
+    области просмотра в мире; при отрисовке из мировых координат вычитается (x, y).
+    Камера не выходит за границы мира, а мир меньше экрана рисуется от левого верхнего угла.
+    """
+
+    def __init__(self, width: int, height: int, world_width: int = 0, world_height: int = 0):
+        self.x = 0
+        self.y = 0
+        self.width = width
+        self.height = height
+        self.world_width = world_width
+        self.world_height = world_height
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        return self.x, self.y
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def set_world_size(self, world_width: int, world_height: int) -> None:
+        self.world_width = world_width
+        self.world_height = world_height
+        self._clamp()
+
+    def follow(self, x: float, y: float) -> None:
+        """Ставит точку мира (x, y) в центр экрана"""
+        self.x = int(x) - self.width // 2
+        self.y = int(y) - self.height // 2
+        self._clamp()
+
+    def _clamp(self) -> None:
+        self.x = max(0, min(self.x, self.world_width - self.width))
+        self.y = max(0, min(self.y, self.world_height - self.height))
+
+
+def camera_offset(ecs) -> tuple[int, int]:
+    """Смещение камеры из переменной ECS 'camera', (0, 0) если камеры нет"""
+    camera: Camera | None = ecs.get_variable('camera')
+    if camera is None:
+        return 0, 0
+    return camera.x, camera.y
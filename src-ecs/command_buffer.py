@@ -0,0 +1,64 @@
+from typing import Type, TYPE_CHECKING
+
+from ecs_types import EntityId, Component
+
+if TYPE_CHECKING:
+    from entity_component_system import EntityComponentSystem
+
+SPAWN = 0
+DESPAWN = 1
+ADD_COMPONENT = 2
+REMOVE_COMPONENT = 3
+
+
+class CommandBuffer:
+    """
+    Отложенные структурные изменения ECS: создание/удаление сущностей и компонентов.
+    Системы пишут сюда во время update, а ECS применяет команды по порядку
+    в точках синхронизации — после каждой системы. Благодаря этому запросы
+    можно обходить прямо по живому хранилищу, без копий
+    """
+
+    def __init__(self, ecs: 'EntityComponentSystem'):
+        self._ecs = ecs
+        self._commands: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def spawn(self, components: list[Component], entity_id: EntityId = None) -> EntityId:
+        """
+        Id выдаётся сразу, а сама сущность появится при применении буфера
+        """
+        entity_id = self._ecs._reserve_entity_id(entity_id)
+        self._commands.append((SPAWN, entity_id, components))
+        return entity_id
+
+    def despawn(self, entity_id: EntityId) -> None:
+        self._commands.append((DESPAWN, entity_id, None))
+
+    def add_component(self, entity_id: EntityId, component: Component) -> None:
+        self._commands.append((ADD_COMPONENT, entity_id, component))
+
+    def remove_component(self, entity_id: EntityId, component_class: Type[Component]) -> None:
+        self._commands.append((REMOVE_COMPONENT, entity_id, component_class))
+
+    def apply(self) -> None:
+        """
+        Применяет все накопленные команды. Команды для уже удалённых сущностей пропускаются
+        """
+        ecs = self._ecs
+        # Команды, добавленные хуками on_create/on_remove во время применения, тоже выполнятся
+        while self._commands:
+            commands, self._commands = self._commands, []
+            for op, entity_id, payload in commands:
+                if op == SPAWN:
+                    ecs._insert_entity(entity_id, payload)
+                elif entity_id not in ecs._entity_archetypes:
+                    continue
+                elif op == DESPAWN:
+                    ecs._remove_entity(entity_id)
+                elif op == ADD_COMPONENT:
+                    ecs._add_component(entity_id, payload)
+                else:
+                    ecs._remove_component(entity_id, payload)
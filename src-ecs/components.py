@@ -92,6 +92,11 @@ class Render(Component):
         default_factory=lambda: pygame.Color(255, 255, 255))
     scale: float = 1.0
     layer: int = 0
+    # Заполняются RenderSystem: выравнивание по клетке определяется по архетипу сущности,
+    # а смещение спрайта пересчитывается только при смене его размера
+    grid_aligned: bool = False
+    offset: Tuple[int, int] = (0, 0)
+    offset_size: Optional[Tuple[int, int]] = None
 
     def get_width(self) -> int:
         if self.sprite:
@@ -0,0 +1,5 @@
+import os
+
+# Тесты запускаются без окна и звука
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -1,2 +1,3 @@
 IS_DEBUG = True
 SHOW_HITBOXES = True
+PROFILE = False
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Type
 from abc import ABC, abstractmethod
 
-EntityId = str
+EntityId = int
 Component = object
 
 
@@ -16,8 +16,30 @@ class System(ABC):
         pass
 
 
+class BatchSystem(System):
+    """
+    Система, которая за один тик получает сразу все подходящие сущности.
+    ECS вызывает update_batch один раз вместо update на каждую сущность,
+    поэтому общие для всех сущностей данные можно достать один раз до цикла
+    """
+
+    def update(self, entity_id: EntityId, components: list[Component], ecs: Any = None):
+        """Для пакетных систем не вызывается"""
+        pass
+
+    @abstractmethod
+    def update_batch(self, query: Any, ecs: Any):
+        """
+        Обновляет все сущности запроса. query.chunks() отдаёт по архетипам
+        (список id, кортеж столбцов компонентов в порядке required_components)
+        """
+        pass
+
+
 @dataclass
 class StoredSystem:
     system: System
     components: list[Type[Component]]
     has_ecs_argument: bool
+    query: Any = None
+    is_batch: bool = False
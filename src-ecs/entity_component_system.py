@@ -1,8 +1,12 @@
 import inspect
+import time
 from typing import Callable, Type, Any, Iterator
 
-from ecs_types import EntityId, Component, StoredSystem, System
-from unique_id import UniqueIdGenerator
+from archetype import Archetype
+from command_buffer import CommandBuffer
+from ecs_types import EntityId, Component, StoredSystem, System, BatchSystem
+from query import Query
+from unique_id import EntityIdAllocator
 
 
 class EntityComponentSystem:
@@ -18,9 +22,21 @@ class EntityComponentSystem:
         """
 
         self._systems: list[StoredSystem] = []
-        self._components: dict[Type[Component], dict[EntityId, Component]] = {}
-        self._entities: list[EntityId] = []
+        # Архетипы по сигнатуре и индекс "класс компонента -> архетипы, где он есть"
+        self._archetypes: dict[frozenset[Type[Component]], Archetype] = {}
+        self._component_archetypes: dict[Type[Component], list[Archetype]] = {}
+        # Реестр живых сущностей: в каком архетипе лежит каждая
+        self._entity_archetypes: dict[EntityId, Archetype] = {}
+        self._entity_ids = EntityIdAllocator()
+        # Кэш запросов: ключ — кортеж классов компонентов в порядке запроса
+        self._queries: dict[tuple[Type[Component], ...], Query] = {}
         self._vars = {}
+        # Пока идёт update, структурные изменения копятся здесь и применяются после каждой системы
+        self.commands = CommandBuffer(self)
+        self._deferring = False
+        # FrameProfiler, если нужно замерять системы; счётчик обращений к запросам для него
+        self.profiler = None
+        self._query_calls = 0
         self.on_create = on_create
         self.on_remove = on_remove
 
@@ -48,13 +64,126 @@ class EntityComponentSystem:
         Возвращает компонент сущности с типом переданного класса component_class
         Кидает KeyError если сущность не существует или не имеет такого компонента
         """
-        return self._components[component_class][entity_id]
+        return self._entity_archetypes[entity_id].get(entity_id, component_class)
+
+    def _get_archetype(self, signature: frozenset[Type[Component]]) -> Archetype:
+        """
+        Возвращает архетип с данной сигнатурой, создавая его при необходимости.
+        Кидает KeyError если какой-то из классов не был инициализирован через init_component
+        """
+        archetype = self._archetypes.get(signature)
+        if archetype is None:
+            archetype_lists = [self._component_archetypes[component_class]
+                               for component_class in signature]
+            archetype = Archetype(signature)
+            for archetype_list in archetype_lists:
+                archetype_list.append(archetype)
+            self._archetypes[signature] = archetype
+            for query in self._queries.values():
+                if query.matches(archetype):
+                    query._attach(archetype)
+        return archetype
+
+    def _get_matching_archetypes(self, component_classes) -> list[Archetype]:
+        """
+        Архетипы, в сигнатуре которых есть все component_classes.
+        Перебирается только самый короткий список из индекса по классам
+        """
+        if not component_classes:
+            return list(self._archetypes.values())
+
+        candidates = min((self._component_archetypes[component_class] for component_class in component_classes),
+                         key=len)
+        return [archetype for archetype in candidates
+                if archetype.signature.issuperset(component_classes)]
+
+    def _move_entity(self, entity_id: EntityId, target: Archetype,
+                     components: dict[Type[Component], Component]) -> None:
+        target.append(entity_id, components)
+        self._entity_archetypes[entity_id] = target
+
+    def _reserve_entity_id(self, entity_id: EntityId = None) -> EntityId:
+        if entity_id is None or not self._entity_ids.claim(entity_id):
+            entity_id = self._entity_ids.allocate()
+        return entity_id
+
+    def _insert_entity(self, entity_id: EntityId, components: list[Component]) -> None:
+        by_class = {component.__class__: component for component in components}
+        try:
+            archetype = self._get_archetype(frozenset(by_class))
+        except KeyError:
+            self._entity_ids.release(entity_id)
+            raise
+
+        archetype.append(entity_id, by_class)
+        self._entity_archetypes[entity_id] = archetype
+
+        if self.on_create:
+            self.on_create(entity_id, components)
+
+    def _remove_entity(self, entity_id: EntityId) -> None:
+        if self.on_remove is not None:
+            self.on_remove(entity_id)
+        archetype = self._entity_archetypes.pop(entity_id)
+        archetype.pop(entity_id)
+        self._entity_ids.release(entity_id)
+
+    def _add_component(self, entity_id: EntityId, component: Component) -> None:
+        component_class = component.__class__
+        archetype = self._entity_archetypes[entity_id]
+        if component_class in archetype.columns:
+            archetype.columns[component_class][archetype.rows[entity_id]] = component
+            # Сущность остаётся в архетипе, но объект компонента другой: кэши,
+            # привязанные к version запроса, должны пересобраться
+            for query in archetype.queries:
+                query.version += 1
+            return
+
+        target = archetype.add_edges.get(component_class)
+        if target is None:
+            target = self._get_archetype(archetype.signature | {component_class})
+            archetype.add_edges[component_class] = target
+            target.remove_edges[component_class] = archetype
+
+        components = archetype.pop(entity_id)
+        components[component_class] = component
+        self._move_entity(entity_id, target, components)
+
+    def _remove_component(self, entity_id: EntityId, component_class: Type[Component]) -> Component | None:
+        archetype = self._entity_archetypes[entity_id]
+        if component_class not in archetype.columns:
+            return None
+
+        target = archetype.remove_edges.get(component_class)
+        if target is None:
+            target = self._get_archetype(archetype.signature - {component_class})
+            archetype.remove_edges[component_class] = target
+            target.add_edges[component_class] = archetype
+
+        components = archetype.pop(entity_id)
+        removed = components.pop(component_class)
+        self._move_entity(entity_id, target, components)
+        return removed
+
+    def query(self, *component_classes) -> Query:
+        """
+        Возвращает зарегистрированный запрос по набору компонентов, создавая его при первом обращении.
+        Дальше ECS поддерживает его в актуальном состоянии сам
+        """
+        self._query_calls += 1
+        query = self._queries.get(component_classes)
+        if query is None:
+            query = Query(self, component_classes)
+            for archetype in self._get_matching_archetypes(component_classes):
+                query._attach(archetype)
+            self._queries[component_classes] = query
+        return query
 
     def init_component(self, component_class: Type[Component]) -> None:
         """
         Инициализация класса компонента. Следует вызвать до создания сущностей
         """
-        self._components[component_class] = {}
+        self._component_archetypes.setdefault(component_class, [])
 
     def add_variable(self, variable_name: str, variable_value: Any) -> None:
         """
@@ -72,7 +201,9 @@ class EntityComponentSystem:
         stored = StoredSystem(
             system=system,
             components=system.required_components,
-            has_ecs_argument=True
+            has_ecs_argument=True,
+            query=self.query(*system.required_components),
+            is_batch=isinstance(system, BatchSystem)
         )
         self._systems.append(stored)
 
@@ -88,67 +219,127 @@ class EntityComponentSystem:
     def create_entity(self, components: list[Component], entity_id=None) -> EntityId:
         """
         Создание сущности на основе списка его компонентов
-        Можно задавать свой entity_id но он обязан быть уникальным
+        Можно задавать свой entity_id, если он занят — будет выдан новый
+        Во время update сущность появится в ближайшей точке синхронизации, id выдаётся сразу
         """
-        if entity_id is None:
-            entity_id = UniqueIdGenerator.generate_id()
-
-        while entity_id in self._entities:
-            entity_id = UniqueIdGenerator.generate_id()
-
-        for component in components:
-            self._components[component.__class__][entity_id] = component
-        self._entities.append(entity_id)
-
-        if self.on_create:
-            self.on_create(entity_id, components)
+        if self._deferring:
+            return self.commands.spawn(components, entity_id)
 
+        entity_id = self._reserve_entity_id(entity_id)
+        self._insert_entity(entity_id, components)
         return entity_id
 
     def get_entity_ids_with_components(self, *component_classes) -> set[EntityId]:
         """
         Получить все entity_id у которых есть каждый из компонентов, указанных в component_classes
         """
-        if not component_classes:
-            return set(self._entities)
-
-        entities = set.intersection(*[set(self._components[component_class].keys())
-                                    for component_class in component_classes])
-        return entities
+        return set(self.query(*component_classes).entity_ids())
 
     def get_entities_with_components(self, *component_classes) -> Iterator[tuple[EntityId, list[Component]]]:
         """
-        Получить все entity_id вместе с указанными компонентами
+        Получить все entity_id вместе с указанными компонентами.
+        Во время update это живой обход хранилища (структурные изменения всё равно
+        откладываются до точки синхронизации); вне update — снимок, поэтому сущности
+        можно удалять и добавлять прямо в цикле по результату
         """
-        for entity_id in self.get_entity_ids_with_components(*component_classes):
-            components = tuple(self._unsafe_get_component(entity_id, component_class)
-                               for component_class in component_classes)
-            yield entity_id, components
+        query = self.query(*component_classes)
+        if self._deferring:
+            return iter(query)
+        return iter(list(query))
 
     def update(self) -> None:
         """
         Вызывает все системы.
         Следует вызывать в игровом цикле.
+        Структурные изменения, сделанные системами, откладываются в self.commands
+        и применяются после каждой системы
         """
-        for stored_system in self._systems:
-            for entity_id in self.get_entity_ids_with_components(*stored_system.components):
-                components = [self._unsafe_get_component(entity_id, component_class)
-                              for component_class in stored_system.components]
+        self.apply_commands()
+        profiler = self.profiler if self.profiler is not None and self.profiler.enabled else None
+        self._deferring = True
+        try:
+            for stored_system in self._systems:
+                if profiler is not None:
+                    self._query_calls = 0
+                    start = time.perf_counter()
+
+                if stored_system.is_batch:
+                    stored_system.system.update_batch(stored_system.query, self)
+                else:
+                    self._update_per_entity(stored_system)
+
+                if profiler is not None:
+                    profiler.record(type(stored_system.system).__name__,
+                                    (time.perf_counter() - start) * 1000.0,
+                                    entities=len(stored_system.query),
+                                    queries=self._query_calls)
+                    start = time.perf_counter()
+                    self.commands.apply()
+                    profiler.record('ecs.sync', (time.perf_counter() - start) * 1000.0)
+                else:
+                    self.commands.apply()
+        finally:
+            self._deferring = False
+            self.commands.apply()
+
+    def _update_per_entity(self, stored_system: StoredSystem) -> None:
+        system = stored_system.system
+        component_classes = stored_system.components
+        for archetype in stored_system.query.archetypes:
+            if not archetype.entities:
+                continue
+            columns = [archetype.columns[component_class] for component_class in component_classes]
+            for row, entity_id in enumerate(archetype.entities):
+                components = [column[row] for column in columns]
 
                 if stored_system.has_ecs_argument:
-                    stored_system.system.update(entity_id, components, self)
+                    system.update(entity_id, components, self)
                 else:
-                    stored_system.system.update(entity_id, components)
+                    system.update(entity_id, components)
+
+    def apply_commands(self) -> None:
+        """
+        Точка синхронизации: применяет накопленные в self.commands изменения
+        """
+        self.commands.apply()
 
     def remove_entity(self, entity_id: EntityId):
         """
         Удаляет сущность
+        Во время update удаление откладывается до ближайшей точки синхронизации
         """
-        if self.on_remove is not None:
-            self.on_remove(entity_id)
-        for components in self._components.values():
-            components.pop(entity_id, None)
-        self._entities.remove(entity_id)
+        if self._deferring:
+            self.commands.despawn(entity_id)
+            return
+        self._remove_entity(entity_id)
+
+    def is_alive(self, entity_id: EntityId) -> bool:
+        """
+        Проверяет, что id принадлежит существующей сущности (а не удалённой, чей слот уже переиспользован)
+        """
+        return self._entity_ids.is_alive(entity_id)
+
+    def add_component(self, entity_id: EntityId, component: Component) -> None:
+        """
+        Добавляет компонент существующей сущности (или заменяет компонент того же класса)
+        Во время update изменение откладывается до ближайшей точки синхронизации
+        """
+        if self._deferring:
+            self.commands.add_component(entity_id, component)
+            return
+        self._add_component(entity_id, component)
+
+    def remove_component(self, entity_id: EntityId, component_class: Type[Component]) -> Component | None:
+        """
+        Убирает компонент у сущности.
+        Во время update изменение откладывается до ближайшей точки синхронизации
+        :return
+        Возвращает убранный компонент или None если его не было (или удаление отложено)
+        """
+        if self._deferring:
+            self.commands.remove_component(entity_id, component_class)
+            return None
+        return self._remove_component(entity_id, component_class)
 
     def get_component(self, entity_id: EntityId, component_class: Type[Component]):
         """
@@ -156,7 +347,13 @@ class EntityComponentSystem:
         Возвращает компонент сущности с типом переданного класса component_class
         Возвращает None если сущность не существует или не имеет такого компонента
         """
-        return self._components[component_class].get(entity_id, None)
+        archetype = self._entity_archetypes.get(entity_id)
+        if archetype is None:
+            return None
+        column = archetype.columns.get(component_class)
+        if column is None:
+            return None
+        return column[archetype.rows[entity_id]]
 
     def get_components(self, entity_id: EntityId, component_classes):
         """
@@ -9,6 +9,7 @@ from map_generator import generate_tile_entities_from_template
 import settings
 import random
 from inventory_data import GLOBAL_STORAGE, ITEM_SPRITE_MAP
+from walkable_grid import WalkableGrid, BLOCKED, FLOOR, STAIRS
 
 
 class EntityFactory:
@@ -65,6 +66,8 @@ class EntityFactory:
         position = pygame.Vector2(
             x * settings.TileMap.TILE_SIZE, y * settings.TileMap.TILE_SIZE)
 
+        self._update_walkable_grid(x, y, tile_type, walkable)
+
         return self.ecs.create_entity(
             [
                 Position(position=position),
@@ -75,12 +78,26 @@ class EntityFactory:
             ]
         )
 
+    def _update_walkable_grid(self, x: int, y: int, tile_type: str, walkable: bool) -> None:
+        grid: WalkableGrid | None = self.ecs.get_variable('walkable_grid')
+        if grid is None:
+            return
+        if not walkable:
+            grid.set(x, y, BLOCKED)
+        elif tile_type == 'stairs':
+            grid.set(x, y, STAIRS)
+        else:
+            grid.set(x, y, FLOOR)
+
     def _get_walkable_tiles(self) -> List:
-        walkable_tiles = []
-        for entity_id, (grid_pos, tile) in self.ecs.get_entities_with_components(GridPosition, TileComponent):
-            if tile.walkable:
-                walkable_tiles.append((grid_pos.x, grid_pos.y))
-        return walkable_tiles
+        grid: WalkableGrid | None = self.ecs.get_variable('walkable_grid')
+        if grid is None:
+            return []
+        return grid.walkable_cells()
+
+    def _is_walkable(self, x: int, y: int) -> bool:
+        grid: WalkableGrid | None = self.ecs.get_variable('walkable_grid')
+        return grid is not None and grid.is_walkable(x, y)
 
     def create_enemy(self) -> EntityId:
         walkable_tiles = self._get_walkable_tiles()
@@ -115,10 +132,10 @@ class EntityFactory:
         )
 
     def create_health_potion(self, x, y) -> EntityId:
-        walkable = self._get_walkable_tiles()
-        if not walkable:
-            return None
-        if x is None or y is None or (x, y) not in walkable:
+        if x is None or y is None or not self._is_walkable(x, y):
+            walkable = self._get_walkable_tiles()
+            if not walkable:
+                return None
             x, y = random.choice(walkable)
 
         position = pygame.Vector2(
@@ -134,10 +151,10 @@ class EntityFactory:
         ])
 
     def create_bomb_pickup(self, x=None, y=None) -> EntityId:
-        walkable = self._get_walkable_tiles()
-        if not walkable:
-            return None
-        if x is None or y is None or (x, y) not in walkable:
+        if x is None or y is None or not self._is_walkable(x, y):
+            walkable = self._get_walkable_tiles()
+            if not walkable:
+                return None
             x, y = random.choice(walkable)
 
         position = pygame.Vector2(
@@ -218,6 +235,11 @@ class EntityFactory:
                 tile_comp.variant = 'stairs'
                 tile_comp.walkable = True
                 render.sprite = self.assets.get_tile_sprite('stairs')
+                self._update_walkable_grid(x, y, 'stairs', True)
+                # Спрайт сменился на месте — запечённый слой тайлов перерисует только эту клетку
+                static_layer = self.ecs.get_variable('static_layer')
+                if static_layer is not None:
+                    static_layer.invalidate_cell(x, y)
                 return eid
 
         return self.create_tile(x, y, 'stairs', 'stairs', True)
@@ -0,0 +1,127 @@
+import pygame
+
+import settings
+from camera import camera_offset
+from components import Health, Inventory, PlayerTag, Position, EnemyTag
+from entity_component_system import EntityComponentSystem
+from text_cache import FONTS, TEXT_CACHE
+from transform_cache import TRANSFORM_CACHE
+
+_UNSET = object()
+
+
+class HudWidget:
+    """Готовая поверхность элемента интерфейса.
+
+    Каждый кадр виджету передаётся ключ — снимок наблюдаемых значений
+    (например, текущее и максимальное здоровье). Поверхность перерисовывается
+    только при смене ключа, причём создаётся новая: по смене id поверхности
+    режим грязных прямоугольников узнаёт, что область нужно обновить.
+    """
+
+    def __init__(self, render):
+        self._render = render
+        self._key = _UNSET
+        self.surface: pygame.Surface | None = None
+        self.renders = 0
+
+    def update(self, key) -> pygame.Surface | None:
+        if key != self._key:
+            self._key = key
+            self.surface = self._render(key)
+            self.renders += 1
+        return self.surface
+
+
+class Hud:
+    """Интерфейс игровой сцены: здоровье игрока, название уровня, полоски HP врагов, инвентарь.
+
+    Виджеты хранят отрисованные поверхности и перерисовываются только при изменении
+    наблюдаемых компонентов; за кадр остаётся собрать несколько готовых поверхностей
+    в последовательность для surface.blits
+    """
+
+    ICON_SIZE = 16
+    ICON_PADDING = 4
+    BAR_HEIGHT = 4
+
+    def __init__(self, ecs: EntityComponentSystem, level_name: str):
+        self._ecs = ecs
+        self.level_name = level_name
+        self.health = HudWidget(self._render_health)
+        self.level = HudWidget(self._render_level)
+        self.inventory = HudWidget(self._render_inventory)
+        # Полоска HP врага по ширине заполненной части (фон и заливка в одной поверхности)
+        self._bars: dict[int, pygame.Surface] = {}
+
+    def blits(self, surface: pygame.Surface) -> list[tuple[pygame.Surface, tuple]]:
+        """Элементы интерфейса поверх мира в виде последовательности для surface.blits"""
+        hud_blits = []
+
+        # ---------------- Здоровье игрока -----------------------------
+        player_health = None
+        for _, (health, _) in self._ecs.query(Health, PlayerTag):
+            player_health = health
+            break
+        if player_health is not None:
+            hud_blits.append((self.health.update((player_health.amount, player_health.max_amount)), (5, 5)))
+
+        # ---------------- Текущий уровень -----------------------------
+        level_text = self.level.update(self.level_name)
+        hud_blits.append((level_text, (surface.get_width() - 5 - level_text.get_width(), 5)))
+
+        # ---------------- HP врагов -----------------------------------
+        bar_height = self.BAR_HEIGHT
+        camera_x, camera_y = camera_offset(self._ecs)
+        for _, (enemy_pos, enemy_health, _) in self._ecs.query(Position, Health, EnemyTag):
+            # Чуть выше спрайта
+            bar_pos = (enemy_pos.position.x - camera_x, enemy_pos.position.y - bar_height - 2 - camera_y)
+            hud_blits.append((self._enemy_bar(enemy_health), bar_pos))
+
+        # ---------------- Инвентарь -----------------------------------
+        inv_comp = None
+        for _, (inv, _) in self._ecs.query(Inventory, PlayerTag):
+            inv_comp = inv
+            break
+        if inv_comp:
+            # Сами спрайты в ключе: сравнение по идентичности и без повторного использования id
+            strip = self.inventory.update(tuple(item.sprite for item in inv_comp.items))
+            hud_blits.append((strip, (5, surface.get_height() - self.ICON_SIZE - 5)))
+
+        return hud_blits
+
+    def _enemy_bar(self, health: Health) -> pygame.Surface:
+        max_bar_width = settings.TileMap.TILE_SIZE
+        hp_ratio = health.amount / health.max_amount if health.max_amount else 0
+        fill_width = int(max_bar_width * hp_ratio)
+        bar = self._bars.get(fill_width)
+        if bar is None:
+            # Красный фон и зелёная заполненная часть
+            bar = pygame.Surface((max_bar_width, self.BAR_HEIGHT))
+            bar.fill((150, 0, 0))
+            if fill_width > 0:
+                bar.fill((0, 255, 0), (0, 0, fill_width, self.BAR_HEIGHT))
+            self._bars[fill_width] = bar
+        return bar
+
+    @staticmethod
+    def _render_health(key: tuple[int, int]) -> pygame.Surface:
+        amount, max_amount = key
+        return TEXT_CACHE.render(FONTS.get(12), f"HP: {amount}/{max_amount}", True, (255, 255, 255))
+
+    @staticmethod
+    def _render_level(level_name: str) -> pygame.Surface:
+        return TEXT_CACHE.render(FONTS.get(12), level_name, True, (255, 255, 255))
+
+    def _render_inventory(self, sprites: tuple[pygame.Surface, ...]) -> pygame.Surface:
+        if not sprites:
+            return TEXT_CACHE.render(FONTS.get(14), "Инвентарь пуст", True, (200, 200, 200))
+
+        icon_size, padding = self.ICON_SIZE, self.ICON_PADDING
+        strip = pygame.Surface((len(sprites) * (icon_size + padding) - padding, icon_size), pygame.SRCALPHA)
+        for idx, sprite in enumerate(sprites):
+            icon = TRANSFORM_CACHE.scale(sprite, (icon_size, icon_size))
+            # Иконки не перекрываются, а полоса прозрачна: копируем пиксели как есть,
+            # без смешивания с прозрачным фоном
+            strip.blit(icon, (idx * (icon_size + padding), 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return strip
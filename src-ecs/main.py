@@ -1,10 +1,13 @@
 from scene_manager import SceneManager
-from scenes import MenuScene
+from scenes import LoadingScene, MenuScene
 import settings
 import pygame
 
 from inventory_data import GLOBAL_STORAGE
+from profiler import FRAME_PROFILER
 from sound_engine import init_sound_engine, SoundEngine
+from upscaler import Upscaler
+from assets import AssetManager
 
 
 class Game:
@@ -15,12 +18,20 @@ class Game:
             (settings.ScreenSettngs.WIDTH, settings.ScreenSettngs.HEIGHT))
         self.display = pygame.Surface((self._screen.get_width() // settings.ScreenSettngs.DISPLAY_RATIO,
                                        self._screen.get_height() // settings.ScreenSettngs.DISPLAY_RATIO))
+        self.upscaler = Upscaler(self.display, self._screen, settings.ScreenSettngs.UPSCALE_FILTER)
+        # Ресурсы общие для всех сцен: после смены уровня повторно с диска ничего не читается
+        self.assets = AssetManager(cache_path=settings.GameSettings.ASSET_CACHE_PATH)
 
         self.clock = pygame.time.Clock()
         self.running = True
+        # Сцена, чей кадр сейчас на экране в режиме грязных прямоугольников
+        self._dirty_scene = None
 
         self.scene_manager = SceneManager()
-        self.scene_manager.change(MenuScene(self.scene_manager, self))
+        # Спрайты из PRELOAD_SPRITES декодируются в фоне, пока показывается экран загрузки
+        self.scene_manager.change(LoadingScene(
+            self.scene_manager, self, self.assets.load_async(),
+            lambda: MenuScene(self.scene_manager, self)))
 
         GLOBAL_STORAGE.inventory.clear()
 
@@ -41,23 +52,43 @@ class Game:
     def run(self):
         while self.running:
             dt_ms = self.clock.tick(settings.GameSettings.TARGET_FPS)
+            FRAME_PROFILER.begin_frame()
             dt = dt_ms / 1000.0
 
             events = pygame.event.get()
             self.scene_manager.handle_events(events)
             self.scene_manager.update(dt)
+            self.assets.poll()
             
             current_scene = self.scene_manager.current
             if hasattr(current_scene, 'draw_hd_ui'):
                 current_scene.draw_hd_ui(self._screen)
+                pygame.display.flip()
+            elif settings.ScreenSettngs.DIRTY_RECTS and hasattr(current_scene, 'draw_dirty'):
+                # Окно перекрывали или сцена сменилась — прошлый кадр на экране недействителен
+                if current_scene is not self._dirty_scene or any(
+                        event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+                    current_scene.invalidate_frame()
+                    self._dirty_scene = current_scene
+                self._present_dirty(current_scene.draw_dirty(self.display))
             else:
                 self.scene_manager.draw(self.display)
-                self._screen.blit(pygame.transform.scale(self.display, self._screen.get_size()), (0, 0))
+                self.upscaler.present()
+                pygame.display.flip()
             
-            pygame.display.flip()
+            FRAME_PROFILER.end_frame()
 
         pygame.quit()
 
+    def _present_dirty(self, rects: list[pygame.Rect] | None) -> None:
+        """Переносит на экран только перерисованные области display (None — весь кадр).
+        Пустой список — кадр не менялся, масштабирование и обновление окна пропускаются"""
+        if rects is None:
+            self.upscaler.present()
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(self.upscaler.present(rects))
+
 
 if __name__ == "__main__":
     Game().run()
@@ -2,100 +2,78 @@ import pygame
 import random
 import settings
 from assets import AssetManager
-import debug
 from components import TileComponent, GridPosition, Render
+from walkable_grid import WalkableGrid
+import autotile
 from typing import TYPE_CHECKING
 
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него шаблон декодируется построчно из байтов
+    np = None
+
 if TYPE_CHECKING:
     from entity_factory import EntityFactory
 
 
-def get_tile_type_by_color(color):
-    """Определяет тип тайла по его цвету"""
-    for tile_type, tile_color in settings.TileMap.COLORS.items():
-        if color == tile_color:
-            return tile_type
-    return 'empty'
-
-
-def get_tile_variant(x, y, pixel_array, width, height):
-    """Определяет вариант тайла на основе его соседей"""
-    def get_neighbor_type(nx, ny):
-        """Возвращает тип соседней клетки (wall, floor или empty)"""
-        if 0 <= nx < width and 0 <= ny < height:
-            pixel_value = pixel_array[nx, ny]
-            color = pygame.Color(*pixel_array.surface.unmap_rgb(pixel_value))
-            return get_tile_type_by_color((color.r, color.g, color.b, color.a))
-        return 'empty'
-
-    current_tile = get_neighbor_type(x, y)
-    up = get_neighbor_type(x, y-1)
-    down = get_neighbor_type(x, y+1)
-    left = get_neighbor_type(x-1, y)
-    right = get_neighbor_type(x+1, y)
-
-    up_left = get_neighbor_type(x-1, y-1)
-    up_right = get_neighbor_type(x+1, y-1)
-    down_left = get_neighbor_type(x-1, y+1)
-    down_right = get_neighbor_type(x+1, y+1)
-
-    if debug.IS_DEBUG:
-        print(f"Позиция ({x}, {y})")
-        print(f"Соседи: верх={up}, низ={down}, лево={left}, право={right}")
-
-    def wall_checks():
-        if current_tile == 'empty':
-            return 'empty'
-        if up in ['floor', 'empty', 'wall'] and down == 'floor':
-            return 'top'
-        if down in ['empty', 'wall'] and up in 'floor':
-            return 'bottom'
-        if left in ['empty', 'wall'] and right in ['floor', 'wall']:
-            return 'left'
-        if right in ['empty', 'wall'] and left in ['floor', 'wall']:
-            return 'right'
-
-# TODO дописать проверку угловых вариантов
-
-    def corners_checks():
-        if up == 'floor' and up_right == 'floor' and right == 'floor' and left == 'wall' and down == 'wall':
-            return 'top_left_corner'
-        if right == 'wall' and down == 'wall' and down_right == 'floor':
-            return 'left'
-        if left == 'wall' and down == 'wall' and down_left == 'floor':
-            return 'right'
-
-        if up == 'wall' and left == 'wall' and up_left == 'floor':
-            return 'bottom_right_corner'
-        if up == 'wall' and right == 'wall' and up_right == 'floor':
-            return 'bottom_left_corner'
-        if up == 'floor' and up_left == 'floor' and left == 'floor' and down == 'wall' and right == 'wall':
-            return 'top_right_corner'
-
-        return None
-
-    if corners_checks() == None:
-        return wall_checks()
-    return corners_checks()
+# Коды типов тайлов в декодированном шаблоне. Неизвестный цвет — 'empty' (код 0)
+TILE_TYPES = ['empty'] + [tile_type for tile_type in settings.TileMap.COLORS if tile_type != 'empty']
+TILE_CODES = {tile_type: code for code, tile_type in enumerate(TILE_TYPES)}
+EMPTY, WALL = TILE_CODES['empty'], TILE_CODES['wall']
+# Для автотайлинга спавн, выход и вход — это проходимые клетки, как пол
+FLOOR_LIKE = tuple(TILE_CODES[tile_type] for tile_type in ('floor', 'spawn', 'exit', 'entry'))
+
+
+def _pack_rgba(r, g, b, a):
+    return (r << 24) | (g << 16) | (b << 8) | a
+
+
+def decode_template(template: pygame.Surface):
+    """Переводит шаблон в массив кодов типов тайлов за один проход.
+    С NumPy возвращает массив формы (height, width), без него — плоский bytearray
+    с индексом y * width + x. Цвета сравниваются как упакованные 32-битные RGBA
+    """
+    width, height = template.get_size()
+    if np is not None:
+        rgb = pygame.surfarray.pixels3d(template)
+        alpha = pygame.surfarray.pixels_alpha(template)
+        packed = _pack_rgba(rgb[..., 0].astype(np.uint32), rgb[..., 1].astype(np.uint32),
+                            rgb[..., 2].astype(np.uint32), alpha.astype(np.uint32)).T
+        del rgb, alpha  # снимаем блокировку поверхности
+        types = np.zeros((height, width), dtype=np.uint8)
+        for tile_type, color in settings.TileMap.COLORS.items():
+            types[packed == _pack_rgba(*color)] = TILE_CODES[tile_type]
+        return types
+
+    lookup = {bytes(color): TILE_CODES[tile_type] for tile_type, color in settings.TileMap.COLORS.items()}
+    data = pygame.image.tobytes(template, 'RGBA')
+    return bytearray(lookup.get(data[i:i + 4], EMPTY) for i in range(0, len(data), 4))
 
 
 def generate_tile_entities_from_template(template_path: str, factory: "EntityFactory"):
     """Генерирует сущности тайлов из шаблона
     Возвращает координаты точки спавна игрока (если найдена).
     """
-    template = pygame.image.load(template_path).convert_alpha()
+    template = factory.assets.get_template(template_path)
     width, height = template.get_size()
-    pixel_array = pygame.PixelArray(template)
+    types = decode_template(template)
+    if np is not None:
+        wall_variants = autotile.wall_variants(np.isin(types, FLOOR_LIKE), types == WALL).tobytes()
+        types = types.tobytes()
+    else:
+        is_floor = bytes(code in FLOOR_LIKE for code in types)
+        is_wall = bytes(code == WALL for code in types)
+
+    # Сетка проходимости заполняется в factory.create_tile по мере создания тайлов
+    factory.ecs.add_variable('walkable_grid', WalkableGrid(width, height))
 
     spawn_coords = None  # (x, y)
     exit_coords = None   # (x, y)
 
     for x in range(width):
         for y in range(height):
-            pixel_value = pixel_array[x, y]
-            color = pygame.Color(*template.unmap_rgb(pixel_value))
-            tile_type = get_tile_type_by_color(
-                (color.r, color.g, color.b, color.a))
+            index = y * width + x
+            tile_type = TILE_TYPES[types[index]]
 
             if tile_type == 'spawn':
                 spawn_coords = (x, y)
@@ -115,7 +93,10 @@ def generate_tile_entities_from_template(template_path: str, factory: "EntityFac
 
             walkable = (tile_type == 'floor')
             if tile_type == 'wall':
-                variant = get_tile_variant(x, y, pixel_array, width, height)
+                if np is not None:
+                    variant = autotile.VARIANTS[wall_variants[index]]
+                else:
+                    variant = autotile.wall_variant(x, y, is_floor, is_wall, width, height)
             elif tile_type == 'floor':  # floor
                 variant = random.choice(settings.TileMap.FLOOR_TILES)
             else:  # empty tile
@@ -123,6 +104,4 @@ def generate_tile_entities_from_template(template_path: str, factory: "EntityFac
 
             factory.create_tile(x, y, tile_type, variant, walkable)
 
-    del pixel_array
-
     return spawn_coords, exit_coords
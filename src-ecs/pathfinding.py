@@ -1,84 +1,79 @@
-from typing import Dict, List, Tuple, Set
-import heapq
-import math
+from typing import List, Tuple, Optional
+from collections import deque
 
 
-class Node:
-    def __init__(self, position: Tuple[int, int], g_cost: float = float('inf'),
-                 h_cost: float = 0, parent: 'Node' = None):
-        self.position = position
-        self.g_cost = g_cost
-        self.h_cost = h_cost
-        self.parent = parent
+class DistanceField:
+    """Карта расстояний (BFS) от одной цели до каждой проходимой клетки.
 
-    @property
-    def f_cost(self) -> float:
-        return self.g_cost + self.h_cost
+    Строится один раз за ход за O(размер карты), после чего любой враг узнаёт
+    свой следующий шаг к цели за O(1): это соседняя клетка с меньшим расстоянием.
+    Клетки хранятся плоским массивом с индексом y * width + x.
+    """
+    UNREACHABLE = -1
 
-    def __lt__(self, other: 'Node') -> bool:
-        return self.f_cost < other.f_cost
-
-
-class AStar:
     def __init__(self):
         self.directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-    def heuristic(self, start: Tuple[int, int], end: Tuple[int, int]) -> float:
-        return abs(end[0] - start[0]) + abs(end[1] - start[1])
-
-    def get_neighbors(self, current: Tuple[int, int], walkable_tiles: Set[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        neighbors = []
+        self.width = 0
+        self.height = 0
+        self.goal: Optional[Tuple[int, int]] = None
+        self.distances: List[int] = []
+
+    def build(self, walkable, width: int, height: int, goal: Tuple[int, int]) -> None:
+        """walkable — плоская последовательность (bytearray) длины width * height, 1 = проходимо"""
+        self.width = width
+        self.height = height
+        self.goal = goal
+        distances = [self.UNREACHABLE] * (width * height)
+        self.distances = distances
+
+        gx, gy = goal
+        if not (0 <= gx < width and 0 <= gy < height) or not walkable[gy * width + gx]:
+            return
+
+        distances[gy * width + gx] = 0
+        frontier = deque([goal])
+        while frontier:
+            x, y = frontier.popleft()
+            next_distance = distances[y * width + x] + 1
+            for dx, dy in self.directions:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    index = ny * width + nx
+                    if walkable[index] and distances[index] == self.UNREACHABLE:
+                        distances[index] = next_distance
+                        frontier.append((nx, ny))
+
+    def distance(self, position: Tuple[int, int]) -> int:
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.distances[y * self.width + x]
+        return self.UNREACHABLE
+
+    def next_step(self, position: Tuple[int, int], blocked=()) -> Optional[Tuple[int, int]]:
+        """Соседняя клетка, которая ближе всего к цели и не занята (blocked).
+        None, если цель недостижима, уже достигнута или все шаги вперёд заняты."""
+        current = self.distance(position)
+        if current <= 0:
+            return None
+
+        best = None
+        best_distance = current
+        x, y = position
         for dx, dy in self.directions:
-            neighbor = (current[0] + dx, current[1] + dy)
-            if neighbor in walkable_tiles:
-                neighbors.append(neighbor)
-        return neighbors
-
-    def find_path(self, start: Tuple[int, int], end: Tuple[int, int],
-                  walkable_tiles: Set[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        if start not in walkable_tiles or end not in walkable_tiles:
+            neighbor = (x + dx, y + dy)
+            distance = self.distance(neighbor)
+            if distance != self.UNREACHABLE and distance < best_distance and neighbor not in blocked:
+                best = neighbor
+                best_distance = distance
+        return best
+
+    def path(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Путь от position до клетки рядом с целью (саму цель не включает), спуском по полю"""
+        if self.distance(position) == self.UNREACHABLE:
             return []
-
-        start_node = Node(start, g_cost=0, h_cost=self.heuristic(start, end))
-
-        open_list: List[Node] = [start_node]
-        closed_set: Set[Tuple[int, int]] = set()
-
-        nodes: Dict[Tuple[int, int], Node] = {start: start_node}
-
-        while open_list:
-            current = heapq.heappop(open_list)
-
-            if current.position == end:
-                path = []
-                while current:
-                    path.append(current.position)
-                    current = current.parent
-                return path[::-1]
-
-            closed_set.add(current.position)
-
-            for neighbor_pos in self.get_neighbors(current.position, walkable_tiles):
-                if neighbor_pos in closed_set:
-                    continue
-
-                g_cost = current.g_cost + 1
-
-                if neighbor_pos not in nodes:
-                    neighbor = Node(
-                        neighbor_pos,
-                        g_cost=g_cost,
-                        h_cost=self.heuristic(neighbor_pos, end),
-                        parent=current
-                    )
-                    nodes[neighbor_pos] = neighbor
-                    heapq.heappush(open_list, neighbor)
-                else:
-                    neighbor = nodes[neighbor_pos]
-                    if g_cost < neighbor.g_cost:
-                        neighbor.g_cost = g_cost
-                        neighbor.parent = current
-                        if neighbor not in open_list:
-                            heapq.heappush(open_list, neighbor)
-
-        return []
+        path = [position]
+        step = self.next_step(position)
+        while step is not None and step != self.goal:
+            path.append(step)
+            step = self.next_step(step)
+        return path
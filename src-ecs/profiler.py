@@ -0,0 +1,178 @@
+import csv
+import json
+import math
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import pygame
+
+import debug
+import settings
+from text_cache import FONTS
+
+
+@dataclass(slots=True)
+class SectionSample:
+    """Замер одной секции (системы, прохода отрисовки) за один кадр"""
+    time_ms: float = 0.0
+    entities: int = 0
+    queries: int = 0
+    calls: int = 0
+
+
+class FrameProfiler:
+    """Встроенный профайлер: время по системам и проходам отрисовки за последние N кадров.
+
+    Кадры хранятся в кольцевом буфере, по нему считаются скользящие перцентили.
+    Результаты можно вывести поверх игры (draw_overlay) или сохранить в CSV/JSON.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, history: int = 240, enabled: bool = False):
+        self.enabled = enabled
+        self.show_overlay = enabled
+        self.frames: deque[tuple[int, dict[str, SectionSample]]] = deque(maxlen=history)
+        self.frame_index = 0
+        self._current: dict[str, SectionSample] = {}
+        self._frame_start = 0.0
+        # Кадр начат begin_frame при включённом профайлере; если профайлер включили
+        # посреди кадра, end_frame этот неполный кадр не записывает
+        self._frame_open = False
+        self._background: pygame.Surface | None = None
+
+    # ------------------------------------------------------------------
+    # Запись
+    # ------------------------------------------------------------------
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = time.perf_counter()
+        self._frame_open = True
+
+    def end_frame(self) -> None:
+        if not self.enabled or not self._frame_open:
+            self._frame_open = False
+            self._current = {}
+            return
+        self._frame_open = False
+        self.record('frame', (time.perf_counter() - self._frame_start) * 1000.0)
+        self.frames.append((self.frame_index, self._current))
+        self.frame_index += 1
+        self._current = {}
+
+    def record(self, name: str, time_ms: float, entities: int = 0, queries: int = 0) -> None:
+        """Добавляет замер к секции текущего кадра (повторные вызовы суммируются)"""
+        sample = self._current.get(name)
+        if sample is None:
+            sample = self._current[name] = SectionSample()
+        sample.time_ms += time_ms
+        sample.entities += entities
+        sample.queries += queries
+        sample.calls += 1
+
+    def section(self, name: str, entities: int = 0):
+        """Контекстный менеджер для замера произвольного блока кода"""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name, entities)
+
+    @contextmanager
+    def _timed(self, name: str, entities: int):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000.0, entities)
+
+    # ------------------------------------------------------------------
+    # Статистика
+    # ------------------------------------------------------------------
+
+    def section_names(self) -> list[str]:
+        names = {}
+        for _, samples in self.frames:
+            for name in samples:
+                names[name] = None
+        return list(names)
+
+    def percentiles(self, name: str, percentiles=PERCENTILES) -> dict[int, float]:
+        """Перцентили времени секции (мс) по кадрам в буфере, метод ближайшего ранга"""
+        values = sorted(samples[name].time_ms for _, samples in self.frames if name in samples)
+        if not values:
+            return {p: 0.0 for p in percentiles}
+        return {p: values[max(0, math.ceil(p / 100 * len(values)) - 1)] for p in percentiles}
+
+    def summary(self) -> list[dict]:
+        """Строка на каждую секцию: перцентили времени и средние счётчики, самые дорогие сверху"""
+        rows = []
+        for name in self.section_names():
+            samples = [frame[name] for _, frame in self.frames if name in frame]
+            row = {'section': name}
+            for p, value in self.percentiles(name).items():
+                row[f'p{p}_ms'] = round(value, 3)
+            row['avg_entities'] = round(sum(s.entities for s in samples) / len(samples), 1)
+            row['avg_queries'] = round(sum(s.queries for s in samples) / len(samples), 1)
+            rows.append(row)
+        rows.sort(key=lambda r: r['p95_ms'], reverse=True)
+        return rows
+
+    # ------------------------------------------------------------------
+    # Вывод
+    # ------------------------------------------------------------------
+
+    def draw_overlay(self, surface: pygame.Surface, max_rows: int = 12) -> None:
+        if not (self.enabled and self.show_overlay):
+            return
+        font = FONTS.get(8)
+
+        lines = ['section             p50    p95    p99  ent']
+        for row in self.summary()[:max_rows]:
+            lines.append(f"{row['section'][:18]:<18}{row['p50_ms']:>6.2f} {row['p95_ms']:>6.2f} "
+                         f"{row['p99_ms']:>6.2f} {int(row['avg_entities']):>4}")
+
+        line_height = font.get_linesize()
+        background_size = (surface.get_width(), line_height * len(lines) + 4)
+        background = self._background
+        if background is None or background.get_size() != background_size:
+            background = pygame.Surface(background_size)
+            background.set_alpha(170)
+            background.fill((0, 0, 0))
+            self._background = background
+        y = surface.get_height() - background.get_height()
+        surface.blit(background, (0, y))
+        for i, line in enumerate(lines):
+            surface.blit(font.render(line, False, (180, 255, 180)), (2, y + 2 + i * line_height))
+
+    def dump_csv(self, path: Path) -> None:
+        """Сырые замеры: одна строка на (кадр, секция)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['frame', 'section', 'time_ms', 'entities', 'queries', 'calls'])
+            for frame_index, samples in self.frames:
+                for name, sample in samples.items():
+                    writer.writerow([frame_index, name, round(sample.time_ms, 4),
+                                     sample.entities, sample.queries, sample.calls])
+
+    def dump_json(self, path: Path) -> None:
+        """Сводка по перцентилям и сырые замеры"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'summary': self.summary(),
+            'frames': [{'frame': frame_index,
+                        'sections': {name: asdict(sample) for name, sample in samples.items()}}
+                       for frame_index, samples in self.frames],
+        }
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding='utf-8')
+
+
+FRAME_PROFILER = FrameProfiler(enabled=debug.PROFILE)
+PROFILE_DIR = settings.GameSettings.BASE_DIR / 'profiles'
@@ -0,0 +1,64 @@
+from typing import Type, Iterator, TYPE_CHECKING
+
+from ecs_types import EntityId, Component
+
+if TYPE_CHECKING:
+    from archetype import Archetype
+    from entity_component_system import EntityComponentSystem
+
+
+class Query:
+    """
+    Зарегистрированный в ECS запрос по набору компонентов.
+    ECS сам дописывает в него новые подходящие архетипы, поэтому повторный
+    обход стоит O(совпадений) и не строит никаких множеств.
+
+    version увеличивается каждый раз, когда сущность попадает в запрос или выпадает из него,
+    а также при замене компонента сущности запроса на другой объект (add_component)
+    """
+
+    def __init__(self, ecs: 'EntityComponentSystem', component_classes: tuple[Type[Component], ...]):
+        self._ecs = ecs
+        self.component_classes = component_classes
+        self.signature = frozenset(component_classes)
+        self.archetypes: list['Archetype'] = []
+        self.version = 0
+
+    def matches(self, archetype: 'Archetype') -> bool:
+        return archetype.signature.issuperset(self.signature)
+
+    def _attach(self, archetype: 'Archetype') -> None:
+        self.archetypes.append(archetype)
+        archetype.queries.append(self)
+        if archetype.entities:
+            self.version += 1
+
+    def __len__(self) -> int:
+        return sum(len(archetype) for archetype in self.archetypes)
+
+    def chunks(self) -> Iterator[tuple[list[EntityId], tuple[list[Component], ...]]]:
+        """
+        Отдаёт по каждому непустому архетипу список id и столбцы компонентов в порядке запроса.
+        Это живые списки хранилища: структурные изменения во время update идут через ecs.commands
+        """
+        component_classes = self.component_classes
+        for archetype in self.archetypes:
+            if archetype.entities:
+                yield archetype.entities, tuple(archetype.columns[component_class]
+                                                for component_class in component_classes)
+
+    def entity_ids(self) -> list[EntityId]:
+        return [entity_id for archetype in self.archetypes for entity_id in archetype.entities]
+
+    def __iter__(self) -> Iterator[tuple[EntityId, tuple[Component, ...]]]:
+        """
+        Обходит живое хранилище без копий. Во время update структурные изменения
+        откладываются ECS, а вне update их нужно делать после обхода
+        """
+        component_classes = self.component_classes
+        for archetype in self.archetypes:
+            if not archetype.entities:
+                continue
+            columns = tuple(archetype.columns[component_class] for component_class in component_classes)
+            for row, entity_id in enumerate(archetype.entities):
+                yield entity_id, tuple(column[row] for column in columns)
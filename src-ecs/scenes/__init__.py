@@ -2,6 +2,7 @@
 Модуль сцен игры.
 
 Содержит все игровые сцены:
+- LoadingScene - экран загрузки ресурсов
 - MenuScene - главное меню
 - TutorialScene - обучение и инструкции
 - MapTestScene - тестирование генератора карт
@@ -10,6 +11,7 @@
 - GameSceneLevel01-10 - уровни игры
 """
 
+from .loading_scene import LoadingScene
 from .menu_scene import MenuScene
 from .tutorial_scene import TutorialScene
 from .map_test_scene import MapTestScene
@@ -28,6 +30,7 @@ from .game_level_10 import GameSceneLevel10
 from .victory_scene import VictoryScene
 
 __all__ = [
+    'LoadingScene',
     'MenuScene',
     'TutorialScene',
     'MapTestScene',
@@ -2,7 +2,8 @@ import pygame
 from pygame import Color
 
 import settings
-from assets import AssetManager
+import debug
+from assets import AssetManager, LoadJob, PRELOAD_SPRITES
 from entity_factory import EntityFactory
 from entity_component_system import EntityComponentSystem
 from components import *
@@ -11,3 +12,9 @@ from scene_manager import Scene, SceneManager
 import os
 from pathlib import Path
 from sound_engine import SoundEngine
+from profiler import FRAME_PROFILER, PROFILE_DIR
+from walkable_grid import WalkableGrid
+from transform_cache import TRANSFORM_CACHE
+from text_cache import FONTS, TEXT_CACHE
+from camera import Camera, camera_offset
+from hud import Hud
@@ -5,13 +5,14 @@ from .game_scene import GameScene
 class GameSceneLevel01(GameScene):
     """Первый уровень игры"""
 
+    TEMPLATE_PATH = str(
+        settings.GameSettings.BASE_DIR
+        / "data" / "images" / "Map" / "levels" / "level_01.png"
+    )
+
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         self._prev_template = settings.TileMap.TEMPLATE_PATH
-        alt_template = str(
-            settings.GameSettings.BASE_DIR
-            / "data" / "images" / "Map" / "levels" / "level_01.png"
-        )
-        settings.TileMap.TEMPLATE_PATH = alt_template
+        settings.TileMap.TEMPLATE_PATH = self.TEMPLATE_PATH
         super().__init__(
             manager,
             app,
@@ -30,8 +31,6 @@ class GameSceneLevel01(GameScene):
 
     def _draw_hints(self, surface: pygame.Surface) -> None:
         """Отрисовывает подсказки по управлению для первого уровня"""
-        hint_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 11)
-
         # Подсказки по управлению
         hints = [
             "Управление:",
@@ -49,10 +48,8 @@ class GameSceneLevel01(GameScene):
         bg_height = len(hints) * line_height + 10
         bg_rect = pygame.Rect(x_start - 5, y_start - 5, bg_width, bg_height)
 
-        # Создаем полупрозрачную поверхность для фона
-        bg_surface = pygame.Surface((bg_width, bg_height))
-        bg_surface.set_alpha(180)
-        bg_surface.fill((0, 0, 0))
+        # Полупрозрачная поверхность для фона (создаётся один раз)
+        bg_surface = self._bar_surface(bg_width, bg_height, (0, 0, 0), 180)
         surface.blit(bg_surface, (x_start - 5, y_start - 5))
 
         # Рамка
@@ -65,5 +62,5 @@ class GameSceneLevel01(GameScene):
             else:
                 color = (200, 200, 200)
 
-            text_surf = hint_font.render(hint, True, color)
+            text_surf = TEXT_CACHE.render(FONTS.get(11), hint, True, color)
             surface.blit(text_surf, (x_start, y_start + i * line_height))
@@ -5,13 +5,14 @@ from .game_scene import GameScene
 class GameSceneLevel02(GameScene):
     """Второй уровень игры"""
 
+    TEMPLATE_PATH = str(
+        settings.GameSettings.BASE_DIR
+        / "data" / "images" / "Map" / "levels" / "level_02.png"
+    )
+
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         self._prev_template = settings.TileMap.TEMPLATE_PATH
-        alt_template = str(
-            settings.GameSettings.BASE_DIR
-            / "data" / "images" / "Map" / "levels" / "level_02.png"
-        )
-        settings.TileMap.TEMPLATE_PATH = alt_template
+        settings.TileMap.TEMPLATE_PATH = self.TEMPLATE_PATH
         super().__init__(
             manager,
             app,
@@ -28,7 +29,6 @@ class GameSceneLevel02(GameScene):
         self._set_next_scene(GameSceneLevel03)
 
     def _draw_hints(self, surface: pygame.Surface) -> None:
-        hint_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 9)
 
         hints = [
             "G - подобрать предмет",
@@ -44,9 +44,7 @@ class GameSceneLevel02(GameScene):
         bg_height = len(hints) * line_height + 10
         bg_rect = pygame.Rect(x_start - 5, y_start - 5, bg_width, bg_height)
 
-        bg_surface = pygame.Surface((bg_width, bg_height))
-        bg_surface.set_alpha(180)
-        bg_surface.fill((0, 0, 0))
+        bg_surface = self._bar_surface(bg_width, bg_height, (0, 0, 0), 180)
         surface.blit(bg_surface, (x_start - 5, y_start - 5))
 
         pygame.draw.rect(surface, (100, 150, 100), bg_rect, 1)
@@ -56,5 +54,5 @@ class GameSceneLevel02(GameScene):
                 color = (150, 255, 150)
                 color = (200, 200, 200)
 
-            text_surf = hint_font.render(hint, True, color)
+            text_surf = TEXT_CACHE.render(FONTS.get(9), hint, True, color)
             surface.blit(text_surf, (x_start, y_start + i * line_height))
@@ -5,13 +5,14 @@ from .game_scene import GameScene
 class GameSceneLevel04(GameScene):
     """Четвертый уровень игры"""
 
+    TEMPLATE_PATH = str(
+        settings.GameSettings.BASE_DIR
+        / "data" / "images" / "Map" / "levels" / "level_04.png"
+    )
+
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         self._prev_template = settings.TileMap.TEMPLATE_PATH
-        alt_template = str(
-            settings.GameSettings.BASE_DIR
-            / "data" / "images" / "Map" / "levels" / "level_04.png"
-        )
-        settings.TileMap.TEMPLATE_PATH = alt_template
+        settings.TileMap.TEMPLATE_PATH = self.TEMPLATE_PATH
         super().__init__(
             manager,
             app,
@@ -7,8 +7,8 @@ class GameOverScene(Scene):
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         super().__init__(manager)
         self.app = app
-        self.font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 48)
-        self.small_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 32)
+        self.font = FONTS.get(48)
+        self.small_font = FONTS.get(32)
         self.options = ["Сыграть ещё", "Выход"]
         self.selected = 0
         self.animation_time = 0.0  # Время для анимации
@@ -61,12 +61,9 @@ class GameOverScene(Scene):
         scale_factor = settings.ScreenSettngs.DISPLAY_RATIO
 
         # Создаем шрифты в высоком разрешении
-        hd_title_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(48 * scale_factor), bold=True)
-        hd_menu_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(24 * scale_factor))
-        hd_hint_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(12 * scale_factor))
+        hd_title_font = FONTS.get(int(48 * scale_factor), bold=True)
+        hd_menu_font = FONTS.get(int(24 * scale_factor))
+        hd_hint_font = FONTS.get(int(12 * scale_factor))
 
         # Темно-красный градиентный фон
         hd_surface.fill((40, 10, 10))
@@ -80,7 +77,7 @@ class GameOverScene(Scene):
         red_component = int(255 * flicker_intensity)
         title_color = (red_component, 50, 50)
 
-        # Рендерим заголовок в высоком разрешении
+        # Рендерим заголовок в высоком разрешении (цвет меняется каждый кадр — без кэша)
         title_surf = hd_title_font.render("GAME OVER", True, title_color)
 
         # Масштабируем заголовок
@@ -96,7 +93,7 @@ class GameOverScene(Scene):
 
         # Добавляем тень под заголовком для драматичности
         shadow_offset = int(3 * scale_factor)
-        shadow_surf = hd_title_font.render("GAME OVER", True, (20, 5, 5))
+        shadow_surf = TEXT_CACHE.render(hd_title_font, "GAME OVER", True, (20, 5, 5))
         scaled_shadow = pygame.transform.smoothscale(
             shadow_surf, (scaled_width, scaled_height))
         hd_surface.blit(
@@ -115,7 +112,7 @@ class GameOverScene(Scene):
             if i == self.selected:
                 color = (255, 150, 150)  # Светло-красный для выбранного
                 # Добавляем рамку вокруг выбранного пункта
-                text_surf = hd_menu_font.render(text, True, color)
+                text_surf = TEXT_CACHE.render(hd_menu_font, text, True, color)
                 text_x = (hd_surface.get_width() - text_surf.get_width()) // 2
                 text_y = start_y + i * (hd_menu_font.get_height() + spacing)
 
@@ -132,7 +129,7 @@ class GameOverScene(Scene):
             else:
                 # Тусклый красноватый для обычных пунктов
                 color = (180, 120, 120)
-                text_surf = hd_menu_font.render(text, True, color)
+                text_surf = TEXT_CACHE.render(hd_menu_font, text, True, color)
                 text_x = (hd_surface.get_width() - text_surf.get_width()) // 2
                 text_y = start_y + i * (hd_menu_font.get_height() + spacing)
                 hd_surface.blit(text_surf, (text_x, text_y))
@@ -150,7 +147,7 @@ class GameOverScene(Scene):
             total_hint_height
 
         for i, hint_text in enumerate(hint_texts):
-            hint_surf = hd_hint_font.render(hint_text, True, (120, 80, 80))
+            hint_surf = TEXT_CACHE.render(hd_hint_font, hint_text, True, (120, 80, 80))
             hint_x = (hd_surface.get_width() - hint_surf.get_width()) // 2
             hint_y = start_hint_y + i * \
                 (hd_hint_font.get_height() + hint_spacing)
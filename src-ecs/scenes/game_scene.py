@@ -1,4 +1,5 @@
 from .base_scene import *
+from .loading_scene import LoadingScene
 
 
 class GameScene(Scene):
@@ -13,6 +14,19 @@ class GameScene(Scene):
         bombs – количество бомб на уровне
     """
 
+    # Больше изменившихся областей за кадр — перерисовываем кадр целиком
+    MAX_DIRTY_RECTS = 64
+    # Шаблон карты уровня (None — settings.TileMap.TEMPLATE_PATH), задаётся подклассами
+    TEMPLATE_PATH: str | None = None
+
+    @classmethod
+    def asset_manifest(cls) -> list[str]:
+        """Ресурсы уровня для фоновой загрузки: общие спрайты и шаблон карты"""
+        manifest = list(PRELOAD_SPRITES)
+        if cls.TEMPLATE_PATH is not None:
+            manifest.append(cls.TEMPLATE_PATH)
+        return manifest
+
     def __init__(
         self,
         manager: SceneManager,
@@ -32,7 +46,8 @@ class GameScene(Scene):
         # Инициализируем ECS и всё, что раньше было в Game.__init__.
         # -----------------------------------------------------------------
         self.ecs = EntityComponentSystem()
-        self.assets = AssetManager()
+        self.ecs.profiler = FRAME_PROFILER
+        self.assets = self.app.assets
         self.factory = EntityFactory(self.ecs, self.assets, self.app.display)
 
         # Компоненты
@@ -62,11 +77,14 @@ class GameScene(Scene):
         # Переменные
         self.ecs.add_variable('render_target', RenderTarget(
             surface=self.app.display, assets=self.assets))
+        # Камера размером с экран; размер мира она узнаёт из сетки карты
+        self.ecs.add_variable('camera', Camera(*self.app.display.get_size()))
 
         # Системы
         self.ecs.add_system(InputSystem())
         self.ecs.add_system(GridMovementSystem())
         self.ecs.add_system(PositionSyncSystem())
+        self.ecs.add_system(CameraSystem())
         self.ecs.add_system(DeathSystem())
         self.ecs.add_system(RenderSystem())
         self.ecs.add_system(BombSystem())
@@ -99,13 +117,23 @@ class GameScene(Scene):
         self._place_items_randomly(health_potions, bombs)
 
         self.exit_tile_spawned = False
+        # Интерфейс: виджеты перерисовываются только при изменении здоровья, инвентаря и т.п.
+        self.hud = Hud(self.ecs, self.level_name)
+        # Готовые залитые поверхности (фон подсказок) по (ширина, высота, цвет, прозрачность)
+        self._bar_surfaces: dict[tuple, pygame.Surface] = {}
+        # Прошлый кадр для режима грязных прямоугольников (см. draw_dirty)
+        self._last_frame = None
+        self._hints_rect: pygame.Rect | None = None
         # По умолчанию класс следующей сцены — None, переопределяется ниже
         self.next_scene_cls = None  # type: ignore
+        # Фоновая загрузка ресурсов следующей сцены (см. _set_next_scene)
+        self._next_assets: LoadJob | None = None
         # По умолчанию следующий уровень — GameSceneLevel01
-        # (класс определяется далее в файле, поэтому ссылка допустима)
+        # (класс определяется далее в файле, поэтому ссылка допустима).
+        # Без фоновой загрузки: её запускает _set_next_scene подкласса
         try:
             from .game_level_01 import GameSceneLevel01
-            self._set_next_scene(GameSceneLevel01)  # type: ignore  # noqa: F821
+            self.next_scene_cls = GameSceneLevel01  # type: ignore  # noqa: F821
         except ImportError:
             # Класс ещё не определён в момент импорта — оставим None,
             # подкласс или внешний код должен установить вручную.
@@ -127,6 +155,13 @@ class GameScene(Scene):
                 # Загружаем вторую сцену-уровень
                 from .game_level_01 import GameSceneLevel01
                 self.manager.change(GameSceneLevel01(self.manager, self.app))
+            # --- Профайлер: F3 — вкл/выкл с оверлеем, F4 — сохранить замеры --
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                FRAME_PROFILER.enabled = not FRAME_PROFILER.enabled
+                FRAME_PROFILER.show_overlay = FRAME_PROFILER.enabled
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                FRAME_PROFILER.dump_csv(PROFILE_DIR / 'frames.csv')
+                FRAME_PROFILER.dump_json(PROFILE_DIR / 'frames.json')
 
     def update(self, dt: float) -> None:
         # передаём dt (мс) системам
@@ -168,9 +203,14 @@ class GameScene(Scene):
                     SoundEngine.get().play('teleport', volume=0.7)
                 except RuntimeError:
                     pass
-                # Переходим на следующий уровень
-                self.manager.change(
-                    self.next_scene_cls(self.manager, self.app))
+                # Переходим на следующий уровень; если его ресурсы ещё грузятся — через экран загрузки
+                next_scene_cls = self.next_scene_cls
+                if self._next_assets is not None and not self._next_assets.done:
+                    self.manager.change(LoadingScene(
+                        self.manager, self.app, self._next_assets,
+                        lambda: next_scene_cls(self.manager, self.app)))
+                else:
+                    self.manager.change(next_scene_cls(self.manager, self.app))
 
         # Проверяем, жив ли игрок (если умер — GameOver)
         player_alive = False
@@ -184,78 +224,143 @@ class GameScene(Scene):
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill(Color('black'))
         render_system: RenderSystem = self.ecs.get_system(RenderSystem)
-        render_system.draw_all(self.ecs)
-        self.enemy_pathfinding_system.draw_debug(self.ecs)
+        with FRAME_PROFILER.section('RenderSystem.draw_all', len(self.ecs.query(Position, Render))):
+            render_system.draw_all(self.ecs)
+        with FRAME_PROFILER.section('EnemyPathfindingSystem.draw_debug'):
+            self.enemy_pathfinding_system.draw_debug(self.ecs)
 
         # подсветка зоны взрыва
         bomb_sys = self.ecs.get_system(BombSystem)
         if bomb_sys:
-            bomb_sys.draw_debug(self.ecs)
+            with FRAME_PROFILER.section('BombSystem.draw_debug'):
+                bomb_sys.draw_debug(self.ecs)
 
         # отладочная отрисовка хитбоксов
-        self.hitbox_debug_system.draw_debug(self.ecs)
+        with FRAME_PROFILER.section('HitboxDebugSystem.draw_debug'):
+            self.hitbox_debug_system.draw_debug(self.ecs)
 
-        # ---------------- UI: здоровье игрока -------------------------
-        player_health = None
-        for _, (health, _) in self.ecs.get_entities_with_components(Health, PlayerTag):
-            player_health = health
-            break
-        if player_health is not None:
-            font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 12)
-            text_surf = font.render(
-                f"HP: {player_health.amount}/{player_health.max_amount}", True, (255, 255, 255))
-            surface.blit(text_surf, (5, 5))
-
-        # ---------------- UI: текущий уровень -------------------------
-        font_level = pygame.font.SysFont(settings.ScreenSettngs.FONT, 12)
-        level_text = font_level.render(self.level_name, True, (255, 255, 255))
-        level_rect = level_text.get_rect()
-        level_rect.topright = (surface.get_width() - 5, 5)
-        surface.blit(level_text, level_rect)
-
-        # ---------------- HP врагов ------------------------------------
-        for _, (enemy_pos, enemy_health, _) in self.ecs.get_entities_with_components(Position, Health, EnemyTag):
-            # Полоска здоровья
-            max_bar_width = settings.TileMap.TILE_SIZE
-            bar_height = 4
-            bar_x = enemy_pos.position.x
-            bar_y = enemy_pos.position.y - bar_height - 2  # чуть выше спрайта
-
-            # Красный фон
-            pygame.draw.rect(surface, (150, 0, 0),
-                             (bar_x, bar_y, max_bar_width, bar_height))
-            # Зелёная заполненная часть
-            hp_ratio = enemy_health.amount / \
-                enemy_health.max_amount if enemy_health.max_amount else 0
-            pygame.draw.rect(surface, (0, 255, 0), (bar_x, bar_y, int(
-                max_bar_width * hp_ratio), bar_height))
-
-        # ---------------- Инвентарь ------------------------------------
-        inv_comp = None
-        for _, (inv, _) in self.ecs.get_entities_with_components(Inventory, PlayerTag):
-            inv_comp = inv
-            break
-        if inv_comp:
-            padding = 4
-            icon_size = 16
-            x_offset = 5
-            y_offset = surface.get_height() - icon_size - 5
-            if not inv_comp.items:
-                font_inv = pygame.font.SysFont(settings.ScreenSettngs.FONT, 14)
-                surf_inv = font_inv.render(
-                    "Инвентарь пуст", True, (200, 200, 200))
-                surface.blit(surf_inv, (x_offset, y_offset))
-            else:
-                for idx, inv_item in enumerate(inv_comp.items):
-                    icon = pygame.transform.smoothscale(
-                        inv_item.sprite, (icon_size, icon_size))
-                    surface.blit(
-                        icon, (x_offset + idx * (icon_size + padding), y_offset))
+        # ---------------- UI --------------------------------------------
+        surface.blits(self.hud.blits(surface), doreturn=False)
 
         # ---------------- Подсказки управления ------------------------
         self._draw_hints(surface)
 
+        # ---------------- Профайлер ------------------------------------
+        FRAME_PROFILER.draw_overlay(surface)
+
+    def draw_dirty(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        """Режим грязных прямоугольников: кадр собирается как список (поверхность, позиция),
+        сравнивается с прошлым кадром, и перерисовываются только изменившиеся области.
+
+        Возвращает прямоугольники экрана, которые нужно обновить (пустой список — кадр
+        не изменился), или None, если кадр перерисован целиком. Целиком рисуется первый кадр,
+        кадр после сдвига камеры или перерисовки слоя тайлов, а также кадры, в которых
+        draw рисует отладочные оверлеи или профайлер (см. _debug_overlay_drawn) — они
+        рисуются мимо списка. С настройками debug.py по умолчанию хитбоксы видны
+        в каждом кадре, так что на деле режим работает при выключенной отладке
+        """
+        if self._debug_overlay_drawn() or FRAME_PROFILER.enabled:
+            self._last_frame = None
+            self.draw(surface)
+            return None
+
+        render_system: RenderSystem = self.ecs.get_system(RenderSystem)
+        with FRAME_PROFILER.section('RenderSystem.collect', len(self.ecs.query(Position, Render))):
+            frame = render_system.collect(self.ecs, surface)
+        frame += self.hud.blits(surface)
+
+        static_layer = self.ecs.get_variable('static_layer')
+        frame_key = (camera_offset(self.ecs), static_layer.version)
+        items = {}
+        for item_surface, (x, y) in frame:
+            rect = (int(x), int(y), item_surface.get_width(), item_surface.get_height())
+            key = (id(item_surface),) + rect
+            items[key] = items.get(key, 0) + 1
+
+        previous = self._last_frame
+        self._last_frame = (frame_key, items)
+        if previous is None or previous[0] != frame_key:
+            self._draw_full_frame(surface, frame)
+            return None
+
+        previous_items = previous[1]
+        dirty = [pygame.Rect(key[1:]) for key, count in items.items() if previous_items.get(key, 0) != count]
+        dirty += [pygame.Rect(key[1:]) for key in previous_items if key not in items]
+        camera_x, camera_y = frame_key[0]
+        dirty += [rect.move(-camera_x, -camera_y) for rect in static_layer.changed_rects]
+
+        screen_rect = surface.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        if not dirty:
+            return []
+        # Слишком много мелких областей — дешевле перерисовать кадр целиком
+        if len(dirty) > self.MAX_DIRTY_RECTS:
+            self._draw_full_frame(surface, frame)
+            return None
+
+        dirty = self._merge_rects(dirty)
+        for rect in dirty:
+            surface.set_clip(rect)
+            surface.fill(Color('black'))
+            surface.blits([item for item in frame
+                           if rect.colliderect((item[1], item[0].get_size()))], doreturn=False)
+            if self._hints_rect is None or rect.colliderect(self._hints_rect):
+                self._draw_hints(surface)
+        surface.set_clip(None)
+        return dirty
+
+    def _debug_overlay_drawn(self) -> bool:
+        """Рисует ли draw в этом кадре отладочные оверлеи: пути врагов, зоны бомб, хитбоксы"""
+        if not debug.IS_DEBUG:
+            return False
+        if any(self.enemy_pathfinding_system.current_paths.values()):
+            return True
+        if self.ecs.get_system(BombSystem) is not None and len(self.ecs.query(Bomb, GridPosition)):
+            return True
+        return debug.SHOW_HITBOXES and len(self.ecs.query(Position, Hitbox)) > 0
+
+    def invalidate_frame(self) -> None:
+        """Следующий draw_dirty перерисует кадр целиком"""
+        self._last_frame = None
+
+    def _draw_full_frame(self, surface: pygame.Surface, frame: list) -> None:
+        surface.fill(Color('black'))
+        surface.blits(frame, doreturn=False)
+        self._draw_hints(surface)
+        if self._hints_rect is None:
+            # Подсказки рисуются напрямую, поэтому их область определяем один раз по пикселям
+            hints_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._draw_hints(hints_layer)
+            self._hints_rect = hints_layer.get_bounding_rect()
+
+    @staticmethod
+    def _merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Объединяет пересекающиеся прямоугольники, чтобы не перерисовывать области дважды"""
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
     # ------------------------------------------------------------------
+    def _bar_surface(self, width: int, height: int, color: tuple, alpha: int | None = None) -> pygame.Surface:
+        """Залитый прямоугольник (например, фон подсказок), создаётся один раз
+        на размер, цвет и прозрачность"""
+        key = (width, height, color, alpha)
+        bar = self._bar_surfaces.get(key)
+        if bar is None:
+            bar = pygame.Surface((width, height))
+            bar.fill(color)
+            if alpha is not None:
+                bar.set_alpha(alpha)
+            self._bar_surfaces[key] = bar
+        return bar
+
     def _draw_hints(self, surface: pygame.Surface) -> None:
         """Отрисовывает подсказки по управлению в правом верхнем углу.
         Переопределяется в подклассах для разных уровней."""
@@ -266,13 +371,10 @@ class GameScene(Scene):
         import random
 
         # Находим все свободные клетки (пол) на карте
-        free_positions = []
-        for entity_id, (grid_pos, tile_comp) in self.ecs.get_entities_with_components(GridPosition, TileComponent):
-            if tile_comp.tile_type == "floor":
-                pos = (grid_pos.x, grid_pos.y)
-                # Проверяем, что на этой позиции нет игрока или врагов
-                if not self._is_position_occupied(pos):
-                    free_positions.append(pos)
+        grid: WalkableGrid | None = self.ecs.get_variable('walkable_grid')
+        floor_cells = grid.floor_cells() if grid is not None else []
+        occupied = self._occupied_positions()
+        free_positions = [pos for pos in floor_cells if pos not in occupied]
 
         # Перемешиваем позиции для случайного размещения
         random.shuffle(free_positions)
@@ -295,23 +397,19 @@ class GameScene(Scene):
             x, y = free_positions[potions_placed + i]
             self.factory.create_bomb_pickup(x, y)
 
-    def _is_position_occupied(self, pos: tuple[int, int]) -> bool:
-        """Проверяет, занята ли позиция игроком или врагами"""
-        x, y = pos
-
-        # Проверяем игрока
+    def _occupied_positions(self) -> set[tuple[int, int]]:
+        """Клетки, занятые игроком или врагами"""
+        occupied = set()
         for _, (grid_pos, _) in self.ecs.get_entities_with_components(GridPosition, PlayerTag):
-            if grid_pos.x == x and grid_pos.y == y:
-                return True
-
-        # Проверяем врагов
+            occupied.add((grid_pos.x, grid_pos.y))
         for _, (grid_pos, _) in self.ecs.get_entities_with_components(GridPosition, EnemyTag):
-            if grid_pos.x == x and grid_pos.y == y:
-                return True
-
-        return False
+            occupied.add((grid_pos.x, grid_pos.y))
+        return occupied
 
     # ------------------------------------------------------------------
     def _set_next_scene(self, scene_cls):
-        """Утилита для установки следующей сцены, вызывается подклассами."""
+        """Утилита для установки следующей сцены, вызывается подклассами.
+        Ресурсы следующего уровня начинают загружаться в фоне, пока идёт текущий."""
         self.next_scene_cls = scene_cls
+        asset_manifest = getattr(scene_cls, 'asset_manifest', None)
+        self._next_assets = self.app.assets.load_async(asset_manifest()) if asset_manifest else None
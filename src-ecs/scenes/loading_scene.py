@@ -0,0 +1,43 @@
+from typing import Callable
+
+from .base_scene import *
+
+
+class LoadingScene(Scene):
+    """Экран загрузки: показывает прогресс фоновой загрузки ресурсов (LoadJob)
+    и, когда всё загружено, обновляет атлас спрайтов (и его кэш на диске)
+    и переключает на сцену, созданную next_scene()"""
+
+    def __init__(self, manager: SceneManager, app: "GameApp", job: LoadJob,  # type: ignore
+                 next_scene: Callable[[], Scene]) -> None:
+        super().__init__(manager)
+        self.app = app
+        self.job = job
+        self.next_scene = next_scene
+        self.font = FONTS.get(12)
+
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.app.running = False
+
+    def update(self, dt: float) -> None:
+        # Готовые спрайты переносит в кэш Game.run (assets.poll), здесь только ждём
+        if self.job.done:
+            self.app.assets.update_atlas()
+            self.manager.change(self.next_scene())
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.fill((25, 25, 35))
+        progress = self.job.progress
+
+        bar_rect = pygame.Rect(0, 0, surface.get_width() // 2, 6)
+        bar_rect.center = surface.get_rect().center
+        pygame.draw.rect(surface, (60, 60, 80), bar_rect)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * progress)
+        pygame.draw.rect(surface, (220, 180, 120), fill_rect)
+
+        text_surf = TEXT_CACHE.render(
+            self.font, f"Загрузка... {int(progress * 100)}%", True, (180, 180, 190))
+        surface.blit(text_surf, text_surf.get_rect(midbottom=(bar_rect.centerx, bar_rect.top - 4)))
@@ -7,8 +7,8 @@ class MapTestScene(Scene):
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         super().__init__(manager)
         self.app = app
-        self.font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 24)
-        self.small_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 16)
+        self.font = FONTS.get(24)
+        self.small_font = FONTS.get(16)
 
         # Сохраняем оригинальный шаблон
         self.original_template = settings.TileMap.TEMPLATE_PATH
@@ -41,7 +41,7 @@ class MapTestScene(Scene):
     def _init_ecs(self):
         """Инициализирует минимальную ECS для отображения карты"""
         self.ecs = EntityComponentSystem()
-        self.assets = AssetManager()
+        self.assets = self.app.assets
         self.factory = EntityFactory(self.ecs, self.assets, self.app.display)
 
         # Инициализируем только необходимые компоненты
@@ -113,13 +113,13 @@ class MapTestScene(Scene):
 
         # Название текущего шаблона
         template_name = Path(self.templates[self.current_template_index]).name
-        title_surf = self.font.render(
-            f"Шаблон: {template_name}", True, (255, 255, 255))
+        title_surf = TEXT_CACHE.render(
+            self.font, f"Шаблон: {template_name}", True, (255, 255, 255))
         surface.blit(title_surf, (10, info_y))
         info_y += 30
 
         # Индекс шаблона
-        index_surf = self.small_font.render(
-            f"Шаблон {self.current_template_index + 1} из {len(self.templates)}", True, (200, 200, 200))
+        index_surf = TEXT_CACHE.render(
+            self.small_font, f"Шаблон {self.current_template_index + 1} из {len(self.templates)}", True, (200, 200, 200))
         surface.blit(index_surf, (10, info_y))
         info_y += 25
@@ -7,9 +7,8 @@ class MenuScene(Scene):
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         super().__init__(manager)
         self.app = app
-        self.title_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, 28, bold=True)
-        self.menu_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 18)
+        self.title_font = FONTS.get(28, bold=True)
+        self.menu_font = FONTS.get(18)
         self.options = ["Начать игру", "Тест генератора карт", "Выход"]
         self.selected = 0
         self.title_animation_time = 0.0
@@ -59,19 +58,16 @@ class MenuScene(Scene):
 
         scale_factor = settings.ScreenSettngs.DISPLAY_RATIO
 
-        hd_title_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(28 * scale_factor), bold=True)
-        hd_menu_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(18 * scale_factor))
-        hd_hint_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(12 * scale_factor))
+        hd_title_font = FONTS.get(int(28 * scale_factor), bold=True)
+        hd_menu_font = FONTS.get(int(18 * scale_factor))
+        hd_hint_font = FONTS.get(int(12 * scale_factor))
 
         hd_surface.fill((25, 25, 35))
 
         pulse_scale = 0.9 + 0.05 * math.sin(self.title_animation_time * 3.0)
 
-        title_surf = hd_title_font.render(
-            "Spooky Dungeon", True, (220, 180, 120))
+        title_surf = TEXT_CACHE.render(
+            hd_title_font, "Spooky Dungeon", True, (220, 180, 120))
 
         scaled_width = int(title_surf.get_width() * pulse_scale)
         scaled_height = int(title_surf.get_height() * pulse_scale)
@@ -91,7 +87,7 @@ class MenuScene(Scene):
         for i, text in enumerate(self.options):
             if i == self.selected:
                 color = (255, 200, 100)
-                text_surf = hd_menu_font.render(text, True, color)
+                text_surf = TEXT_CACHE.render(hd_menu_font, text, True, color)
                 text_x = (hd_surface.get_width() - text_surf.get_width()) // 2
                 text_y = start_y + i * (hd_menu_font.get_height() + spacing)
 
@@ -106,7 +102,7 @@ class MenuScene(Scene):
                 hd_surface.blit(text_surf, (text_x, text_y))
             else:
                 color = (180, 180, 190)
-                text_surf = hd_menu_font.render(text, True, color)
+                text_surf = TEXT_CACHE.render(hd_menu_font, text, True, color)
                 text_x = (hd_surface.get_width() - text_surf.get_width()) // 2
                 text_y = start_y + i * (hd_menu_font.get_height() + spacing)
                 hd_surface.blit(text_surf, (text_x, text_y))
@@ -123,7 +119,7 @@ class MenuScene(Scene):
             total_hint_height
 
         for i, hint_text in enumerate(hint_texts):
-            hint_surf = hd_hint_font.render(hint_text, True, (120, 120, 130))
+            hint_surf = TEXT_CACHE.render(hd_hint_font, hint_text, True, (120, 120, 130))
             hint_x = (hd_surface.get_width() - hint_surf.get_width()) // 2
             hint_y = start_hint_y + i * \
                 (hd_hint_font.get_height() + hint_spacing)
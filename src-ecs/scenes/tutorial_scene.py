@@ -76,20 +76,16 @@ class TutorialScene(Scene):
         scale_factor = settings.ScreenSettngs.DISPLAY_RATIO
 
         # Создаем шрифты в высоком разрешении (уменьшены в 2 раза)
-        hd_title_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(9 * scale_factor), bold=True)
-        hd_section_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(7 * scale_factor), bold=True)
-        hd_text_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(9 * scale_factor))
-        hd_hint_font = pygame.font.SysFont(
-            settings.ScreenSettngs.FONT, int(7 * scale_factor))
+        hd_title_font = FONTS.get(int(9 * scale_factor), bold=True)
+        hd_section_font = FONTS.get(int(7 * scale_factor), bold=True)
+        hd_text_font = FONTS.get(int(9 * scale_factor))
+        hd_hint_font = FONTS.get(int(7 * scale_factor))
 
         # Темно-серый фон
         hd_surface.fill((25, 25, 35))
 
         # Заголовок в левом верхнем углу
-        title_surf = hd_title_font.render("Как играть", True, (220, 180, 120))
+        title_surf = TEXT_CACHE.render(hd_title_font, "Как играть", True, (220, 180, 120))
         title_x = int(10 * scale_factor)
         title_y = int(10 * scale_factor)
         hd_surface.blit(title_surf, (title_x, title_y))
@@ -101,16 +97,16 @@ class TutorialScene(Scene):
 
         for section in self.tutorial_sections:
             # Заголовок секции
-            section_surf = hd_section_font.render(
-                section["title"], True, (255, 200, 100))
+            section_surf = TEXT_CACHE.render(
+                hd_section_font, section["title"], True, (255, 200, 100))
             section_x = int(10 * scale_factor)
             hd_surface.blit(section_surf, (section_x, current_y))
             current_y += section_surf.get_height() + int(2 * scale_factor)
 
             # Пункты управления
             for control in section["controls"]:
-                control_surf = hd_text_font.render(
-                    f"  • {control}", True, (180, 180, 190))
+                control_surf = TEXT_CACHE.render(
+                    hd_text_font, f"  • {control}", True, (180, 180, 190))
                 control_x = int(20 * scale_factor)
                 hd_surface.blit(control_surf, (control_x, current_y))
                 current_y += control_surf.get_height() + line_spacing
@@ -130,7 +126,7 @@ class TutorialScene(Scene):
             total_hint_height
 
         for i, hint_text in enumerate(hint_texts):
-            hint_surf = hd_hint_font.render(hint_text, True, (120, 120, 130))
+            hint_surf = TEXT_CACHE.render(hd_hint_font, hint_text, True, (120, 120, 130))
             hint_x = (hd_surface.get_width() - hint_surf.get_width()) // 2
             hint_y = start_hint_y + i * \
                 (hd_hint_font.get_height() + hint_spacing)
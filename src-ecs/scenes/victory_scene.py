@@ -7,9 +7,9 @@ class VictoryScene(Scene):
     def __init__(self, manager: SceneManager, app: "GameApp") -> None:  # type: ignore
         super().__init__(manager)
         self.app = app
-        self.font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 48)
-        self.medium_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 32)
-        self.small_font = pygame.font.SysFont(settings.ScreenSettngs.FONT, 24)
+        self.font = FONTS.get(48)
+        self.medium_font = FONTS.get(32)
+        self.small_font = FONTS.get(24)
         self.options = ["Сыграть ещё", "Выход"]
         self.selected = 0
         self.animation_time = 0.0
@@ -44,8 +44,8 @@ class VictoryScene(Scene):
         pulse_scale = 0.95 + 0.05 * math.sin(self.animation_time * 2.0)
 
         # Заголовок "ПОЗДРАВЛЯЕМ!"
-        title_surf = self.font.render(
-            "ПОЗДРАВЛЯЕМ!", True, (255, 215, 0))  # Золотой цвет
+        title_surf = TEXT_CACHE.render(
+            self.font, "ПОЗДРАВЛЯЕМ!", True, (255, 215, 0))  # Золотой цвет
         scaled_width = int(title_surf.get_width() * pulse_scale)
         scaled_height = int(title_surf.get_height() * pulse_scale)
         scaled_title = pygame.transform.smoothscale(
@@ -64,7 +64,7 @@ class VictoryScene(Scene):
 
         text_y = surface.get_height() // 3
         for text in congrats_texts:
-            text_surf = self.medium_font.render(text, True, (200, 200, 255))
+            text_surf = TEXT_CACHE.render(self.medium_font, text, True, (200, 200, 255))
             text_x = (surface.get_width() - text_surf.get_width()) // 2
             surface.blit(text_surf, (text_x, text_y))
             text_y += 40
@@ -77,7 +77,7 @@ class VictoryScene(Scene):
 
         for i, text in enumerate(self.options):
             color = (255, 255, 100) if i == self.selected else (180, 180, 180)
-            surf = self.small_font.render(text, True, color)
+            surf = TEXT_CACHE.render(self.small_font, text, True, color)
             x = (surface.get_width() - surf.get_width()) // 2
             y = start_y + i * (self.small_font.get_height() + spacing)
             surface.blit(surf, (x, y))
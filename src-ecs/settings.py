@@ -11,6 +11,10 @@ class ScreenSettngs:
     HEIGHT = 1024/DISPLAY_RATIO
     BACKGROUND_COLOR = (0, 0, 0)
     FONT = 'Verdana'
+    # Обновлять на экране только изменившиеся области (для сцен с draw_dirty)
+    DIRTY_RECTS = True
+    # Фильтр увеличения display до окна: 'nearest', 'scale2x' (при масштабе 2 или 4) или 'smooth'
+    UPSCALE_FILTER = 'nearest'
 
 
 @dataclass
@@ -18,6 +22,8 @@ class GameSettings:
     TARGET_FPS = 60
     DEBUG = False
     BASE_DIR = Path(__file__).resolve().parent.parent
+    # Кэш подготовленных спрайтов (атлас в одном файле), пересобирается при изменении PNG
+    ASSET_CACHE_PATH = BASE_DIR / 'cache' / 'assets.bin'
 
 
 @dataclass
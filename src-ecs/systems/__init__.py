@@ -10,6 +10,7 @@ from .animation_system import AnimationSystem
 from .fireball_system import FireballSystem
 from .hitbox_debug_system import HitboxDebugSystem
 from .inventory_persistence_system import InventoryPersistenceSystem
+from .camera_system import CameraSystem
 
 __all__ = [
     'PositionSyncSystem',
@@ -23,5 +24,6 @@ __all__ = [
     'AnimationSystem',
     'FireballSystem',
     'HitboxDebugSystem',
-    'InventoryPersistenceSystem'
+    'InventoryPersistenceSystem',
+    'CameraSystem'
 ] 
\ No newline at end of file
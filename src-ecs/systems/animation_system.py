@@ -1,18 +1,25 @@
 from components import *
-from ecs_types import EntityId, System
+from ecs_types import BatchSystem
 
 
-class AnimationSystem(System):
+class AnimationSystem(BatchSystem):
     def __init__(self):
         super().__init__()
         self.required_components = [Animation, Render]
 
-    def update(self, entity_id: EntityId, components: list[Component], ecs=None):
-        anim: Animation
-        render: Render
-        anim, render = components
-
+    def update_batch(self, query, ecs):
         delta_ms = ecs.get_variable('delta_ms') or 16
+
+        for entity_ids, (animations, renders) in query.chunks():
+            for entity_id, anim, render in zip(entity_ids, animations, renders):
+                if self._advance(anim, delta_ms):
+                    render.sprite = anim.frames[anim.current_frame]
+                else:
+                    ecs.commands.despawn(entity_id)
+
+    @staticmethod
+    def _advance(anim: Animation, delta_ms: int) -> bool:
+        """Сдвигает кадр анимации. Возвращает False, если сущность надо удалить"""
         anim.elapsed += delta_ms
         while anim.elapsed >= anim.frame_time:
             anim.elapsed -= anim.frame_time
@@ -23,6 +30,5 @@ class AnimationSystem(System):
                 else:
                     anim.current_frame = len(anim.frames) - 1
                     if anim.destroy_on_end:
-                        ecs.remove_entity(entity_id)
-                        return
-            render.sprite = anim.frames[anim.current_frame] 
\ No newline at end of file
+                        return False
+        return True
@@ -2,6 +2,7 @@ from components import *
 from ecs_types import EntityId, System
 import pygame
 import debug
+from camera import camera_offset
 import settings
 from sound_engine import SoundEngine
 
@@ -28,14 +29,13 @@ class BombSystem(System):
                     SoundEngine.get().play('explosion', volume=0.8)
                 except RuntimeError:
                     pass
-                ecs._components[Explosion][entity_id] = Explosion()
+                ecs.commands.add_component(entity_id, Explosion())
         elif bomb.state == 'exploding':
             for tid, (t_grid, t_hp) in ecs.get_entities_with_components(GridPosition, Health):
                 if max(abs(t_grid.x - grid_pos.x), abs(t_grid.y - grid_pos.y)) <= bomb.radius:
                     t_hp.apply_damage(bomb.damage)
 
-            if Bomb in ecs._components and entity_id in ecs._components[Bomb]:
-                del ecs._components[Bomb][entity_id]
+            ecs.commands.remove_component(entity_id, Bomb)
 
     def draw_debug(self, ecs):
         if not (hasattr(debug, 'IS_DEBUG') and debug.IS_DEBUG):
@@ -47,9 +47,11 @@ class BombSystem(System):
 
         tile_sz = settings.TileMap.TILE_SIZE
         surf = render_target.surface
+        camera_x, camera_y = camera_offset(ecs)
         for _, (bomb, gpos) in ecs.get_entities_with_components(Bomb, GridPosition):
             for dx in range(-bomb.radius, bomb.radius + 1):
                 for dy in range(-bomb.radius, bomb.radius + 1):
                     if max(abs(dx), abs(dy)) <= bomb.radius:
-                        rect = pygame.Rect((gpos.x + dx) * tile_sz, (gpos.y + dy) * tile_sz, tile_sz, tile_sz)
+                        rect = pygame.Rect((gpos.x + dx) * tile_sz - camera_x, (gpos.y + dy) * tile_sz - camera_y,
+                                           tile_sz, tile_sz)
                         pygame.draw.rect(surf, pygame.Color(255, 0, 0, 100), rect, 1) 
\ No newline at end of file
@@ -0,0 +1,29 @@
+from components import *
+from ecs_types import EntityId, System
+from camera import Camera
+from walkable_grid import WalkableGrid
+import settings
+
+
+class CameraSystem(System):
+    """Держит игрока в центре камеры, пока камера не упирается в край карты"""
+
+    def __init__(self):
+        super().__init__()
+        self.required_components = [Position, PlayerTag]
+
+    def update(self, entity_id: EntityId, components: list[Component], ecs=None):
+        camera: Camera | None = ecs.get_variable('camera')
+        if camera is None:
+            return
+
+        grid: WalkableGrid | None = ecs.get_variable('walkable_grid')
+        if grid is not None:
+            tile_size = settings.TileMap.TILE_SIZE
+            world_size = (grid.width * tile_size, grid.height * tile_size)
+            if world_size != (camera.world_width, camera.world_height):
+                camera.set_world_size(*world_size)
+
+        position, _ = components
+        half_tile = settings.TileMap.TILE_SIZE // 2
+        camera.follow(position.position.x + half_tile, position.position.y + half_tile)
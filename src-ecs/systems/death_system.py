@@ -22,4 +22,4 @@ class DeathSystem(System):
                 except RuntimeError:
                     pass
 
-            ecs.remove_entity(entity_id) 
\ No newline at end of file
+            ecs.commands.despawn(entity_id) 
\ No newline at end of file
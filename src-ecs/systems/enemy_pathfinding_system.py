@@ -4,7 +4,9 @@ from ecs_types import EntityId, System
 import pygame
 import debug
 import settings
-from pathfinding import AStar
+from pathfinding import DistanceField
+from walkable_grid import WalkableGrid
+from camera import camera_offset
 from sound_engine import SoundEngine
 
 
@@ -12,10 +14,17 @@ class EnemyPathfindingSystem(System):
     def __init__(self):
         super().__init__()
         self.required_components = [GridPosition, EnemyTag]
-        self.pathfinder = AStar()
+        self.distance_field = DistanceField()
         self.current_paths = {}
         self.enemies_moved = 0
 
+        # Состояние текущего хода врагов: карта расстояний до игрока строится
+        # один раз на ход, занятость клеток врагами ведётся поверх неё
+        self._field_key = None
+        self._player_pos = None
+        self._grid: WalkableGrid | None = None
+        self._occupied: dict[tuple[int, int], int] = {}
+
     def update(self, entity_id: EntityId, components: list[Component], ecs=None):
         turn_component = None
         for _, (turn,) in ecs.get_entities_with_components(TurnComponent):
@@ -32,45 +41,75 @@ class EnemyPathfindingSystem(System):
             return
 
         grid_position, _ = components
-        
-        player_pos = None
-        for _, (player_grid_pos, _) in ecs.get_entities_with_components(GridPosition, PlayerTag):
-            player_pos = (player_grid_pos.x, player_grid_pos.y)
-            break
-            
-        if not player_pos:
-            return
 
-        walkable_tiles = set()
-        for _, (tile_grid_pos, tile) in ecs.get_entities_with_components(GridPosition, TileComponent):
-            if tile.walkable:
-                walkable_tiles.add((tile_grid_pos.x, tile_grid_pos.y))
+        if not self._prepare_turn(turn_component, ecs):
+            return
+        player_pos = self._player_pos
 
-        enemy_positions = set()
-        for enemy_id, (enemy_grid_pos, _) in ecs.get_entities_with_components(GridPosition, EnemyTag):
-            if enemy_id != entity_id:
-                enemy_positions.add((enemy_grid_pos.x, enemy_grid_pos.y))
+        current_pos = (grid_position.x, grid_position.y)
+        blocked = self._occupied
+        next_pos = self.distance_field.next_step(current_pos, blocked)
 
-        walkable_tiles = walkable_tiles - enemy_positions
+        if debug.IS_DEBUG:
+            self.current_paths[entity_id] = self.distance_field.path(current_pos)
 
-        current_pos = (grid_position.x, grid_position.y)
-        path = self.pathfinder.find_path(current_pos, player_pos, walkable_tiles)[:-1]
-        
-        self.current_paths[entity_id] = path
-        
         is_wizard = ecs.get_component(entity_id, WizardTag) is not None
         if is_wizard:
-            self._handle_wizard_behavior(entity_id, grid_position, player_pos, path, turn_component, walkable_tiles, enemy_positions, ecs)
+            self._handle_wizard_behavior(entity_id, grid_position, player_pos, next_pos, turn_component, ecs)
             return
 
-        self._handle_general_enemy_movement(entity_id, grid_position, path, turn_component, ecs)
+        self._handle_general_enemy_movement(entity_id, grid_position, next_pos, turn_component, ecs)
+
+    def _prepare_turn(self, turn_component: TurnComponent, ecs) -> bool:
+        """Строит карту расстояний от игрока и карту занятости, если ход или позиция игрока сменились.
+        Возвращает False, если игрока на карте нет."""
+        player_pos = None
+        for _, (player_grid_pos, _) in ecs.get_entities_with_components(GridPosition, PlayerTag):
+            player_pos = (player_grid_pos.x, player_grid_pos.y)
+            break
 
-    def _handle_wizard_behavior(self, entity_id: EntityId, grid_position: GridPosition, player_pos: tuple, 
-                               path: list, turn_component: TurnComponent, walkable_tiles: set, enemy_positions: set, ecs):
+        if not player_pos:
+            return False
+
+        grid: WalkableGrid | None = ecs.get_variable('walkable_grid')
+        if grid is None:
+            return False
+
+        key = (turn_component.turn_count, player_pos, grid.version)
+        if key == self._field_key:
+            return True
+
+        self._grid = grid
+        self.distance_field.build(grid.cells, grid.width, grid.height, player_pos)
+
+        self._occupied = {}
+        for _, (enemy_grid_pos, _) in ecs.get_entities_with_components(GridPosition, EnemyTag):
+            pos = (enemy_grid_pos.x, enemy_grid_pos.y)
+            self._occupied[pos] = self._occupied.get(pos, 0) + 1
+
+        self._player_pos = player_pos
+        self._field_key = key
+        return True
+
+    def _is_walkable(self, pos: tuple[int, int]) -> bool:
+        return self._grid.is_walkable(*pos)
+
+    def _move_enemy(self, grid_position: GridPosition, new_pos: tuple[int, int]):
+        old_pos = (grid_position.x, grid_position.y)
+        count = self._occupied.get(old_pos, 0)
+        if count <= 1:
+            self._occupied.pop(old_pos, None)
+        else:
+            self._occupied[old_pos] = count - 1
+        self._occupied[new_pos] = self._occupied.get(new_pos, 0) + 1
+        grid_position.x, grid_position.y = new_pos
+
+    def _handle_wizard_behavior(self, entity_id: EntityId, grid_position: GridPosition, player_pos: tuple,
+                               next_pos: tuple | None, turn_component: TurnComponent, ecs):
         w_state: WizardState | None = ecs.get_component(entity_id, WizardState)
         if w_state is None:
             w_state = WizardState()
-            ecs._components[WizardState][entity_id] = w_state
+            ecs.commands.add_component(entity_id, w_state)
 
         if turn_component.turn_count - w_state.last_shot_turn >= 4:
             self._create_fireball(grid_position, player_pos, turn_component, w_state, ecs)
@@ -80,13 +119,13 @@ class EnemyPathfindingSystem(System):
 
         current_pos = (grid_position.x, grid_position.y)
         cur_dist = cheb_dist(current_pos, player_pos)
-        next_pos_candidate = path[1] if len(path) > 1 else current_pos
+        next_pos_candidate = next_pos if next_pos is not None else current_pos
         next_dist = cheb_dist(next_pos_candidate, player_pos)
 
         if cur_dist < 4:
-            best_pos = self._find_retreat_position(grid_position, player_pos, walkable_tiles, enemy_positions)
+            best_pos = self._find_retreat_position(grid_position, player_pos)
             if best_pos != current_pos:
-                grid_position.x, grid_position.y = best_pos
+                self._move_enemy(grid_position, best_pos)
                 self._increment_enemy_counter(turn_component, ecs)
                 return
 
@@ -94,7 +133,7 @@ class EnemyPathfindingSystem(System):
             self._increment_enemy_counter(turn_component, ecs)
             return
 
-        self._handle_general_enemy_movement(entity_id, grid_position, path, turn_component, ecs)
+        self._handle_general_enemy_movement(entity_id, grid_position, next_pos, turn_component, ecs)
 
     def _create_fireball(self, grid_position: GridPosition, player_pos: tuple, turn_component: TurnComponent, w_state: WizardState, ecs):
         wizard_pixel_x = grid_position.x * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2
@@ -116,7 +155,7 @@ class EnemyPathfindingSystem(System):
             if assets:
                 sprite = assets.get_sprite('Items/cookie.png')
             pos_px = pygame.Vector2(wizard_pixel_x, wizard_pixel_y)
-            ecs.create_entity([
+            ecs.commands.spawn([
                 Position(position=pos_px),
                 Hitbox(offset_x=-4, offset_y=-4, width=8, height=8),
                 Render(sprite=sprite, scale=1, layer=1),
@@ -125,7 +164,7 @@ class EnemyPathfindingSystem(System):
 
             w_state.last_shot_turn = turn_component.turn_count
 
-    def _find_retreat_position(self, grid_position: GridPosition, player_pos: tuple, walkable_tiles: set, enemy_positions: set):
+    def _find_retreat_position(self, grid_position: GridPosition, player_pos: tuple):
         def cheb_dist(a: tuple[int, int], b: tuple[int, int]):
             return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
         
@@ -138,7 +177,7 @@ class EnemyPathfindingSystem(System):
                 if dx_off == 0 and dy_off == 0:
                     continue
                 cand = (grid_position.x + dx_off, grid_position.y + dy_off)
-                if cand not in walkable_tiles or cand in enemy_positions:
+                if not self._is_walkable(cand) or cand in self._occupied or cand == player_pos:
                     continue
                 d = cheb_dist(cand, player_pos)
                 if d >= 3 and d > best_dist:
@@ -146,25 +185,18 @@ class EnemyPathfindingSystem(System):
                     best_pos = cand
         return best_pos
 
-    def _handle_general_enemy_movement(self, entity_id: EntityId, grid_position: GridPosition, path: list, turn_component: TurnComponent, ecs):
-        if len(path) == 1:
+    def _handle_general_enemy_movement(self, entity_id: EntityId, grid_position: GridPosition, next_pos: tuple | None,
+                                       turn_component: TurnComponent, ecs):
+        current_pos = (grid_position.x, grid_position.y)
+        if self.distance_field.distance(current_pos) == 1:
             self._attack_player(entity_id, ecs)
             self._increment_enemy_counter(turn_component, ecs)
             return
 
-        if len(path) > 1:
-            enemy_positions = set()
-            for enemy_id, (enemy_grid_pos, _) in ecs.get_entities_with_components(GridPosition, EnemyTag):
-                if enemy_id != entity_id:
-                    enemy_positions.add((enemy_grid_pos.x, enemy_grid_pos.y))
-            
-            next_pos = path[1]
-            if next_pos not in enemy_positions:
-                grid_position.x, grid_position.y = next_pos
-                self._increment_enemy_counter(turn_component, ecs)
-
-        if len(path) <= 1:
-            self._increment_enemy_counter(turn_component, ecs)
+        # Путь к игроку закрыт или все шаги вперёд заняты другими врагами — враг стоит на месте
+        if next_pos is not None:
+            self._move_enemy(grid_position, next_pos)
+        self._increment_enemy_counter(turn_component, ecs)
 
     def _attack_player(self, entity_id: EntityId, ecs):
         player_id = None
@@ -202,24 +234,25 @@ class EnemyPathfindingSystem(System):
         if not render_target or not render_target.surface:
             return
 
+        camera_x, camera_y = camera_offset(ecs)
         for entity_id, path in self.current_paths.items():
             if not path:
                 continue
 
             for i in range(len(path) - 1):
                 start_pos = (
-                    path[i][0] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2,
-                    path[i][1] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2
+                    path[i][0] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2 - camera_x,
+                    path[i][1] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2 - camera_y
                 )
                 end_pos = (
-                    path[i + 1][0] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2,
-                    path[i + 1][1] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2
+                    path[i + 1][0] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2 - camera_x,
+                    path[i + 1][1] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2 - camera_y
                 )
                 pygame.draw.line(render_target.surface, pygame.Color('red'), start_pos, end_pos, 2)
 
             for point in path:
                 center_pos = (
-                    point[0] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2,
-                    point[1] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2
+                    point[0] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2 - camera_x,
+                    point[1] * settings.TileMap.TILE_SIZE + settings.TileMap.TILE_SIZE // 2 - camera_y
                 )
                 pygame.draw.circle(render_target.surface, pygame.Color('yellow'), center_pos, 3) 
\ No newline at end of file
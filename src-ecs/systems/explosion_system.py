@@ -2,6 +2,7 @@ from components import *
 from ecs_types import EntityId, System
 import pygame
 import settings
+from transform_cache import TRANSFORM_CACHE
 
 
 class ExplosionSystem(System):
@@ -26,9 +27,9 @@ class ExplosionSystem(System):
 
         tile = settings.TileMap.TILE_SIZE
         target_size = (tile * 3, tile * 3)
-        scaled = [pygame.transform.smoothscale(f, target_size) for f in frames]
+        scaled = [TRANSFORM_CACHE.scale(f, target_size) for f in frames]
 
-        ecs._components[Render][eid] = Render(sprite=scaled[0], scale=1.0, layer=2)
-        ecs._components[Animation][eid] = Animation(frames=scaled, frame_time=100, loop=False, destroy_on_end=True)
+        ecs.commands.add_component(eid, Render(sprite=scaled[0], scale=1.0, layer=2))
+        ecs.commands.add_component(eid, Animation(frames=scaled, frame_time=100, loop=False, destroy_on_end=True))
 
         expl.frames_created = True 
\ No newline at end of file
@@ -2,6 +2,7 @@ from components import *
 from ecs_types import EntityId, System
 import pygame
 import debug
+from camera import camera_offset
 
 
 class HitboxDebugSystem(System):
@@ -21,9 +22,10 @@ class HitboxDebugSystem(System):
             return
             
         surface = render_target.surface
+        camera_x, camera_y = camera_offset(ecs)
         
         for entity_id, (position, hitbox) in ecs.get_entities_with_components(Position, Hitbox):
-            rect = hitbox.get_rect(position)
+            rect = hitbox.get_rect(position).move(-camera_x, -camera_y)
             
             color = pygame.Color(255, 255, 255, 128)
             
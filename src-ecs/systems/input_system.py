@@ -74,7 +74,7 @@ class InputSystem(System):
                 rend = ecs.get_component(item_id, Render)
                 if inv and rend and len(inv.items) < inv.capacity:
                     inv.items.append(InventoryItem(name=item_comp.name, sprite=rend.sprite))
-                    ecs.remove_entity(item_id)
+                    ecs.commands.despawn(item_id)
                 break
 
     def _handle_health_potion(self, entity_id: EntityId, ecs):
@@ -118,7 +118,7 @@ class InputSystem(System):
                     turn_count = turn_component.turn_count if turn_component else 0
                     
                     try:
-                        new_bomb_id = ecs.create_entity([
+                        new_bomb_id = ecs.commands.spawn([
                             Position(position=pygame.Vector2(grid_position.x * settings.TileMap.TILE_SIZE,
                                                              grid_position.y * settings.TileMap.TILE_SIZE)),
                             GridPosition(x=grid_position.x, y=grid_position.y),
@@ -1,17 +1,16 @@
 from components import *
-from ecs_types import EntityId, System
+from ecs_types import BatchSystem
 import settings
 
 
-class PositionSyncSystem(System):
+class PositionSyncSystem(BatchSystem):
     def __init__(self):
         super().__init__()
         self.required_components = [GridPosition, Position]
 
-    def update(self, entity_id: EntityId, components: list[Component], ecs=None):
-        grid_position, position = components
-        target_x = grid_position.x * settings.TileMap.TILE_SIZE
-        target_y = grid_position.y * settings.TileMap.TILE_SIZE
-        
-        position.position.x = target_x
-        position.position.y = target_y 
\ No newline at end of file
+    def update_batch(self, query, ecs):
+        tile_size = settings.TileMap.TILE_SIZE
+        for _, (grid_positions, positions) in query.chunks():
+            for grid_position, position in zip(grid_positions, positions):
+                position.position.x = grid_position.x * tile_size
+                position.position.y = grid_position.y * tile_size
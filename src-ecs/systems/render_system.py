@@ -3,48 +3,243 @@ from entity_component_system import EntityComponentSystem
 from ecs_types import EntityId, System
 import pygame
 import settings
+from transform_cache import TRANSFORM_CACHE
+from camera import Camera
+
+
+def _set_grid_aligned(render: Render, grid_aligned: bool) -> None:
+    if render.grid_aligned != grid_aligned:
+        render.grid_aligned = grid_aligned
+        render.offset_size = None
+
+
+def _prepare_sprite(position: Position, render: Render) -> tuple[pygame.Surface, tuple]:
+    """Масштабирует спрайт и возвращает его вместе с точкой отрисовки"""
+    scaled_sprite = TRANSFORM_CACHE.scale_by(render.sprite, render.scale)
+
+    size = scaled_sprite.get_size()
+    if render.offset_size != size:
+        new_width, new_height = size
+        if render.grid_aligned:
+            offset_x = (settings.TileMap.TILE_SIZE - new_width) // 2
+            offset_y = (settings.TileMap.TILE_SIZE - new_height) // 2
+        else:
+            offset_x = -new_width // 2
+            offset_y = -new_height // 2
+        render.offset = (offset_x, offset_y)
+        render.offset_size = size
+
+    offset_x, offset_y = render.offset
+    return scaled_sprite, (position.position.x + offset_x, position.position.y + offset_y)
+
+
+class StaticLayer:
+    """
+    Заранее отрисованный слой тайлов (layer=0): вместо сотен blit'ов за кадр — несколько.
+    Слой нарезан на чанки по CHUNK_TILES x CHUNK_TILES клеток; чанки лежат в словаре
+    по координатам и служат пространственным индексом: за кадр рисуются только
+    чанки, попавшие в камеру.
+    Слой целиком перерисовывается, когда тайлы добавляются или удаляются
+    (меняется version запроса), а при замене спрайта тайла на месте
+    (например, EntityFactory.create_exit_tile) достаточно invalidate_cell —
+    перерисуется только эта клетка.
+    Доступен системам через переменную ECS 'static_layer'
+    """
+
+    CHUNK_TILES = 16
+
+    def __init__(self, ecs: EntityComponentSystem):
+        self._ecs = ecs
+        self._query = ecs.query(Position, Render, TileComponent)
+        self._query_version = None
+        # Увеличивается при каждой полной перерисовке слоя
+        self.version = 0
+        self.chunk_size = self.CHUNK_TILES * settings.TileMap.TILE_SIZE
+        self.chunks: dict[tuple[int, int], pygame.Surface] = {}
+        # Сущности слоя по клеткам сетки — для перерисовки одной клетки
+        self.cells: dict[tuple[int, int], list[EntityId]] = {}
+        self.entity_ids: set[EntityId] = set()
+        self._dirty_cells: set[tuple[int, int]] = set()
+        # Прямоугольники мира, перерисованные последним update() (без полной перерисовки)
+        self.changed_rects: list[pygame.Rect] = []
+
+    def invalidate_cell(self, x: int, y: int) -> None:
+        self._dirty_cells.add((x, y))
+
+    def _cell_of(self, position: Position) -> tuple[int, int]:
+        tile_size = settings.TileMap.TILE_SIZE
+        return int(position.position.x // tile_size), int(position.position.y // tile_size)
+
+    def update(self) -> None:
+        self.changed_rects = []
+        if self._query_version != self._query.version:
+            self._bake()
+        elif self._dirty_cells:
+            tile_size = settings.TileMap.TILE_SIZE
+            for cell in self._dirty_cells:
+                self._bake_cell(cell)
+                self.changed_rects.append(pygame.Rect(cell[0] * tile_size, cell[1] * tile_size,
+                                                      tile_size, tile_size))
+        self._dirty_cells.clear()
+
+    def visible_chunks(self, view: pygame.Rect):
+        """Чанки, пересекающие прямоугольник мира view: (поверхность, левый верхний угол в мире)"""
+        chunk_size = self.chunk_size
+        for chunk_y in range(view.top // chunk_size, (view.bottom - 1) // chunk_size + 1):
+            for chunk_x in range(view.left // chunk_size, (view.right - 1) // chunk_size + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is not None:
+                    yield chunk, (chunk_x * chunk_size, chunk_y * chunk_size)
+
+    def _blit_to_chunks(self, sprite: pygame.Surface, pos: tuple) -> None:
+        """Рисует спрайт во все чанки, которые он задевает"""
+        chunk_size = self.chunk_size
+        left, top = int(pos[0]), int(pos[1])
+        right, bottom = left + sprite.get_width() - 1, top + sprite.get_height() - 1
+        for chunk_y in range(top // chunk_size, bottom // chunk_size + 1):
+            for chunk_x in range(left // chunk_size, right // chunk_size + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    chunk = pygame.Surface((chunk_size, chunk_size), pygame.SRCALPHA)
+                    self.chunks[(chunk_x, chunk_y)] = chunk
+                chunk.blit(sprite, (pos[0] - chunk_x * chunk_size, pos[1] - chunk_y * chunk_size))
+
+    def _bake(self) -> None:
+        self.chunks = {}
+        self.cells = {}
+        self.entity_ids = set()
+        for entity_id, (position, render, _) in self._query:
+            if render.layer != 0 or not render.sprite:
+                continue
+            _set_grid_aligned(render, True)
+            self._blit_to_chunks(*_prepare_sprite(position, render))
+            self.cells.setdefault(self._cell_of(position), []).append(entity_id)
+            self.entity_ids.add(entity_id)
+        self._query_version = self._query.version
+        self.version += 1
+
+    def _bake_cell(self, cell: tuple[int, int]) -> None:
+        """Перерисовывает одну клетку: очищает её и рисует заново тайлы клетки и соседей,
+        чтобы не потерять части спрайтов, заходящие на клетку"""
+        tile_size = settings.TileMap.TILE_SIZE
+        cell_x, cell_y = cell
+        chunk_key = (cell_x * tile_size // self.chunk_size, cell_y * tile_size // self.chunk_size)
+        chunk = self.chunks.get(chunk_key)
+        if chunk is None:
+            chunk = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
+            self.chunks[chunk_key] = chunk
+        origin_x, origin_y = chunk_key[0] * self.chunk_size, chunk_key[1] * self.chunk_size
+
+        chunk.set_clip(pygame.Rect(cell_x * tile_size - origin_x, cell_y * tile_size - origin_y,
+                                   tile_size, tile_size))
+        chunk.fill((0, 0, 0, 0))
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                for entity_id in self.cells.get((cell_x + dx, cell_y + dy), ()):
+                    position = self._ecs.get_component(entity_id, Position)
+                    render = self._ecs.get_component(entity_id, Render)
+                    if position is None or render is None or not render.sprite:
+                        continue
+                    sprite, (x, y) = _prepare_sprite(position, render)
+                    chunk.blit(sprite, (x - origin_x, y - origin_y))
+        chunk.set_clip(None)
 
 
 class RenderSystem(System):
     def __init__(self):
         super().__init__()
         self.required_components = [Position, Render]
-    
+
+        # Списки отрисовки по слоям. Пересобираются, только когда сущности с Render
+        # появляются/исчезают или перерисован слой тайлов; смена render.layer
+        # подхватывается во время отрисовки
+        self.layers: dict[int, list[tuple[EntityId, Position, Render]]] = {}
+        self._layer_order: list[int] = []
+        self._layers_key = None
+
     def update(self, entity_id: EntityId, components: list[Component], ecs=None):
         pass
 
+    def _rebuild_layers(self, ecs: EntityComponentSystem, static_layer: StaticLayer) -> None:
+        static_ids = static_layer.entity_ids
+        self.layers = {}
+        for archetype in ecs.query(Position, Render).archetypes:
+            if not archetype.entities:
+                continue
+            # Выравнивание по клетке одинаково для всего архетипа
+            grid_aligned = GridPosition in archetype.signature or TileComponent in archetype.signature
+            for entity_id, position, render in zip(archetype.entities,
+                                                   archetype.columns[Position],
+                                                   archetype.columns[Render]):
+                if entity_id in static_ids:
+                    continue
+                _set_grid_aligned(render, grid_aligned)
+                self.layers.setdefault(render.layer, []).append((entity_id, position, render))
+        self._layer_order = sorted(self.layers)
+
+    def _move_to_layer(self, entry: tuple[EntityId, Position, Render], layer: int) -> None:
+        self.layers[layer].remove(entry)
+        new_layer = entry[2].layer
+        if new_layer not in self.layers:
+            self.layers[new_layer] = []
+            self._layer_order = sorted(self.layers)
+        self.layers[new_layer].append(entry)
+
     def draw_all(self, ecs: EntityComponentSystem):
         render_target = ecs.get_variable('render_target')
         if not render_target:
             return
 
         surface = render_target.surface
-        
-        renderable_entities = []
-        for entity_id, (pos, render) in ecs.get_entities_with_components(Position, Render):
-            is_grid_aligned = (
-                ecs.get_component(entity_id, GridPosition) is not None or
-                ecs.get_component(entity_id, TileComponent) is not None
-            )
-            renderable_entities.append((render.layer, pos, render, is_grid_aligned))
-
-        renderable_entities.sort(key=lambda e: e[0])
-
-        for layer, position, render, is_grid_aligned in renderable_entities:
-            if render.sprite:
-                original_size = render.sprite.get_size()
-                new_width = int(original_size[0] * render.scale)
-                new_height = int(original_size[1] * render.scale)
-                scaled_sprite = pygame.transform.smoothscale(
-                    render.sprite,
-                    (new_width, new_height)
-                )
-                
-                if is_grid_aligned:
-                    offset_x = (settings.TileMap.TILE_SIZE - new_width) // 2
-                    offset_y = (settings.TileMap.TILE_SIZE - new_height) // 2
-                else:
-                    offset_x = -new_width // 2
-                    offset_y = -new_height // 2
-                render_pos = (position.position.x + offset_x, position.position.y + offset_y)
-                surface.blit(scaled_sprite, render_pos) 
\ No newline at end of file
+        surface.blits(self.collect(ecs, surface), doreturn=False)
+
+    def collect(self, ecs: EntityComponentSystem, surface: pygame.Surface) -> list[tuple[pygame.Surface, tuple]]:
+        """
+        Собирает кадр мира в последовательность (поверхность, позиция на экране) в порядке слоёв,
+        ничего не рисуя. Чанки тайлов и сущности вне камеры в неё не попадают
+        """
+        static_layer: StaticLayer | None = ecs.get_variable('static_layer')
+        if static_layer is None:
+            static_layer = StaticLayer(ecs)
+            ecs.add_variable('static_layer', static_layer)
+        static_layer.update()
+
+        layers_key = (ecs.query(Position, Render).version, static_layer.version)
+        if layers_key != self._layers_key:
+            self._rebuild_layers(ecs, static_layer)
+            self._layers_key = layers_key
+
+        camera: Camera | None = ecs.get_variable('camera')
+        if camera is not None:
+            view = camera.rect
+        else:
+            view = surface.get_rect()
+        camera_x, camera_y = view.topleft
+        view_right, view_bottom = view.right, view.bottom
+
+        blit_sequence = []
+        static_drawn = False
+        moved = []
+        for layer in self._layer_order:
+            if not static_drawn and layer >= 0:
+                for chunk, (x, y) in static_layer.visible_chunks(view):
+                    blit_sequence.append((chunk, (x - camera_x, y - camera_y)))
+                static_drawn = True
+            for entry in self.layers[layer]:
+                _, position, render = entry
+                if render.layer != layer:
+                    # Слой сменился: в этом кадре рисуем на старом месте, дальше — в новом слое
+                    moved.append((entry, layer))
+                if not render.sprite:
+                    continue
+                sprite, (x, y) = _prepare_sprite(position, render)
+                width, height = sprite.get_size()
+                if x < view_right and y < view_bottom and x + width > camera_x and y + height > camera_y:
+                    blit_sequence.append((sprite, (x - camera_x, y - camera_y)))
+        if not static_drawn:
+            for chunk, (x, y) in static_layer.visible_chunks(view):
+                blit_sequence.append((chunk, (x - camera_x, y - camera_y)))
+
+        for entry, layer in moved:
+            self._move_to_layer(entry, layer)
+        return blit_sequence
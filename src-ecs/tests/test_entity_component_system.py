@@ -0,0 +1,59 @@
+import pygame
+
+from components import GridPosition, Position, Render, RenderTarget, TileComponent
+from entity_component_system import EntityComponentSystem
+from systems.render_system import RenderSystem
+
+
+def _make_ecs(surface: pygame.Surface) -> EntityComponentSystem:
+    ecs = EntityComponentSystem()
+    for component_class in (Position, Render, GridPosition, TileComponent):
+        ecs.init_component(component_class)
+    ecs.add_variable('render_target', RenderTarget(surface=surface))
+    return ecs
+
+
+def _sprite(color) -> pygame.Surface:
+    sprite = pygame.Surface((4, 4))
+    sprite.fill(color)
+    return sprite
+
+
+def test_replaced_component_bumps_query_version():
+    ecs = _make_ecs(pygame.Surface((16, 16)))
+    entity_id = ecs.create_entity([Position(pygame.Vector2(8, 8)), Render(sprite=_sprite((255, 0, 0)))])
+    query = ecs.query(Position, Render)
+    version = query.version
+
+    ecs.add_component(entity_id, Render(sprite=_sprite((0, 0, 255))))
+
+    assert query.version > version
+
+
+def test_draw_all_picks_up_replaced_render():
+    surface = pygame.Surface((16, 16))
+    ecs = _make_ecs(surface)
+    entity_id = ecs.create_entity([Position(pygame.Vector2(8, 8)), Render(sprite=_sprite((255, 0, 0)))])
+    render_system = RenderSystem()
+
+    render_system.draw_all(ecs)
+    assert surface.get_at((8, 8))[:3] == (255, 0, 0)
+
+    ecs.add_component(entity_id, Render(sprite=_sprite((0, 0, 255))))
+    surface.fill((0, 0, 0))
+    render_system.draw_all(ecs)
+    assert surface.get_at((8, 8))[:3] == (0, 0, 255)
+
+
+def test_remove_while_iterating_outside_update():
+    ecs = _make_ecs(pygame.Surface((16, 16)))
+    for i in range(6):
+        ecs.create_entity([Position(pygame.Vector2(i, 0))])
+
+    visited = 0
+    for entity_id, _ in ecs.get_entities_with_components(Position):
+        ecs.remove_entity(entity_id)
+        visited += 1
+
+    assert visited == 6
+    assert not ecs.get_entity_ids_with_components(Position)
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+
+import pygame
+
+import settings
+
+
+class FontRegistry:
+    """Шрифты по ключу (имя, размер, bold, italic): системный шрифт ищется один раз.
+
+    pygame.font.SysFont при каждом вызове заново ищет файл шрифта в системе,
+    поэтому сцены берут шрифты отсюда, а не создают их в draw.
+    """
+
+    def __init__(self):
+        self._fonts: dict[tuple, pygame.font.Font] = {}
+
+    def get(self, size: int, bold: bool = False, italic: bool = False, name: str | None = None) -> pygame.font.Font:
+        key = (name or settings.ScreenSettngs.FONT, int(size), bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(key[0], key[1], bold=bold, italic=italic)
+            self._fonts[key] = font
+        return font
+
+    def clear(self) -> None:
+        self._fonts.clear()
+
+
+class TextCache:
+    """Кэш отрендеренных строк с вытеснением давно не использованных (LRU).
+
+    Ключ — (текст, id шрифта, цвет, antialias). Как и в TransformCache, вместе
+    с результатом хранится сам шрифт, чтобы его id не достался другому объекту.
+    Возвращаемую поверхность нельзя изменять: она общая для всех, кто рисует
+    ту же строку.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[pygame.font.Font, pygame.Surface]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        """То же, что font.render(text, antialias, color), но строка рендерится один раз"""
+        key = (text, id(font), tuple(color), antialias)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is font:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        text_surf = font.render(text, antialias, color)
+        self._entries[key] = (font, text_surf)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return text_surf
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+FONTS = FontRegistry()
+TEXT_CACHE = TextCache()
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import pygame
+
+SMOOTH = 'smooth'
+NEAREST = 'nearest'
+
+
+class TransformCache:
+    """Кэш масштабированных спрайтов с вытеснением давно не использованных (LRU).
+
+    Ключ — (id исходной поверхности, целевой размер, фильтр). Вместе с результатом
+    хранится и сама исходная поверхность: пока запись в кэше, её id не может
+    достаться другой поверхности. Масштаб 1.0 (или совпадающий размер)
+    возвращает исходную поверхность без копирования.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[pygame.Surface, pygame.Surface]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scale(self, surface: pygame.Surface, size: tuple[int, int], filter: str = SMOOTH) -> pygame.Surface:
+        size = (int(size[0]), int(size[1]))
+        if surface.get_size() == size:
+            return surface
+
+        key = (id(surface), size, filter)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is surface:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        if filter == NEAREST:
+            scaled = pygame.transform.scale(surface, size)
+        else:
+            scaled = pygame.transform.smoothscale(surface, size)
+        self._entries[key] = (surface, scaled)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return scaled
+
+    def scale_by(self, surface: pygame.Surface, factor: float, filter: str = SMOOTH) -> pygame.Surface:
+        if factor == 1.0:
+            return surface
+        width, height = surface.get_size()
+        return self.scale(surface, (int(width * factor), int(height * factor)), filter)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+TRANSFORM_CACHE = TransformCache()
@@ -1,7 +1,74 @@
-class UniqueIdGenerator:
-    last_id = 0
+from ecs_types import EntityId
 
-    @classmethod
-    def generate_id(cls) -> str:
-        cls.last_id += 1
-        return str(cls.last_id)
+# Младшие INDEX_BITS бит id — номер слота, старшие — поколение слота
+INDEX_BITS = 24
+INDEX_MASK = (1 << INDEX_BITS) - 1
+# claim может занять слот не дальше чем на столько за последним выданным:
+# иначе один большой id растянул бы таблицы поколений на миллионы слотов
+MAX_CLAIM_GAP = 1 << 16
+
+
+class EntityIdAllocator:
+    """
+    Выдаёт компактные целочисленные id сущностей за O(1).
+    Освобождённые слоты переиспользуются через множество свободных слотов, а счётчик поколений
+    делает старые id недействительными: is_alive(старый_id) вернёт False
+    """
+
+    def __init__(self):
+        self._generations: list[int] = []
+        self._alive = bytearray()
+        self._free: set[int] = set()
+
+    def allocate(self) -> EntityId:
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._generations)
+            self._generations.append(0)
+            self._alive.append(0)
+        self._alive[index] = 1
+        return (self._generations[index] << INDEX_BITS) | index
+
+    def claim(self, entity_id: EntityId) -> bool:
+        """
+        Занимает конкретный id, если его слот свободен.
+        :return
+        Возвращает False если слот уже занят живой сущностью, поколение id старше
+        текущего поколения слота (устаревший id не оживает) или слот дальше
+        MAX_CLAIM_GAP за последним выданным
+        """
+        index = entity_id & INDEX_MASK
+        generation = entity_id >> INDEX_BITS
+        if entity_id < 0 or index >= len(self._generations) + MAX_CLAIM_GAP:
+            return False
+        while len(self._generations) <= index:
+            self._free.add(len(self._generations))
+            self._generations.append(0)
+            self._alive.append(0)
+        if self._alive[index] or generation < self._generations[index]:
+            return False
+        self._free.discard(index)
+        self._generations[index] = generation
+        self._alive[index] = 1
+        return True
+
+    def release(self, entity_id: EntityId) -> None:
+        """
+        Освобождает id. Кидает KeyError если id не принадлежит живой сущности
+        """
+        if not self.is_alive(entity_id):
+            raise KeyError(entity_id)
+        index = entity_id & INDEX_MASK
+        self._alive[index] = 0
+        self._generations[index] += 1
+        self._free.add(index)
+
+    def is_alive(self, entity_id: EntityId) -> bool:
+        index = entity_id & INDEX_MASK
+        return (index < len(self._generations)
+                and self._alive[index] == 1
+                and self._generations[index] == entity_id >> INDEX_BITS)
+
+    def __len__(self) -> int:
+        return len(self._generations) - len(self._free)
@@ -0,0 +1,96 @@
+import pygame
+
+NEAREST = 'nearest'
+SCALE2X = 'scale2x'
+SMOOTH = 'smooth'
+FILTERS = (NEAREST, SCALE2X, SMOOTH)
+
+
+class Upscaler:
+    """Перенос низкого разрешения (display) в окно без выделения памяти каждый кадр.
+
+    Масштаб пишется сразу в поверхность окна (dest_surface в pygame.transform),
+    а если форматы не совпадают — в заранее созданный буфер того же размера.
+    Фильтры: nearest — целочисленное увеличение пикселей, scale2x — сглаживание
+    краёв пиксель-арта (только при кратном двум масштабе), smooth — билинейный.
+    """
+
+    def __init__(self, source: pygame.Surface, target: pygame.Surface, filter: str = NEAREST):
+        if filter not in FILTERS:
+            raise ValueError(f'Неизвестный фильтр масштабирования: {filter}')
+        self.source = source
+        self.target = target
+        self.ratio_x = target.get_width() // source.get_width()
+        self.ratio_y = target.get_height() // source.get_height()
+        if filter == SCALE2X and not (self.ratio_x == self.ratio_y and self.ratio_x in (2, 4)):
+            filter = NEAREST
+        self.filter = filter
+
+        # Промежуточные буферы: на случай несовпадения форматов, для частичного
+        # обновления scale2x и для второго прохода scale2x при масштабе 4
+        self._buffer = pygame.Surface(target.get_size(), 0, source)
+        self._half_buffer = (pygame.Surface((source.get_width() * 2, source.get_height() * 2), 0, source)
+                             if self.filter == SCALE2X and self.ratio_x == 4 else None)
+        self._direct = self._can_scale_into(target)
+        # Сколько проходов scale2x делает _scale: каждый смотрит на соседей пикселя,
+        # поэтому изменение пикселя задевает результат на столько пикселей вокруг
+        self._passes = 2 if self._half_buffer is not None else 1
+
+    def _can_scale_into(self, target: pygame.Surface) -> bool:
+        try:
+            pygame.transform.scale(self.source.subsurface((0, 0, 1, 1)),
+                                   (self.ratio_x, self.ratio_y),
+                                   target.subsurface((0, 0, self.ratio_x, self.ratio_y)))
+        except ValueError:
+            return False
+        return True
+
+    def _scale(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        if self.filter == SMOOTH:
+            pygame.transform.smoothscale(source, dest.get_size(), dest)
+        elif self.filter == SCALE2X:
+            if self.ratio_x == 2:
+                pygame.transform.scale2x(source, dest)
+            else:
+                half = self._half_buffer.subsurface((0, 0, source.get_width() * 2, source.get_height() * 2))
+                pygame.transform.scale2x(source, half)
+                pygame.transform.scale2x(half, dest)
+        else:
+            pygame.transform.scale(source, dest.get_size(), dest)
+
+    def present(self, rects: list[pygame.Rect] | None = None) -> list[pygame.Rect]:
+        """Масштабирует весь display (rects=None) или только указанные его области.
+        Возвращает изменённые прямоугольники окна.
+        smoothscale области не совпадает с соответствующей частью целого кадра,
+        поэтому фильтр smooth всегда масштабирует кадр целиком"""
+        if rects is None or self.filter == SMOOTH:
+            if self._direct:
+                self._scale(self.source, self.target)
+            else:
+                self._scale(self.source, self._buffer)
+                self.target.blit(self._buffer, (0, 0))
+            return [self.target.get_rect()]
+
+        ratio_x, ratio_y = self.ratio_x, self.ratio_y
+        source_bounds = self.source.get_rect()
+        screen_rects = []
+        for rect in rects:
+            if self.filter == SCALE2X:
+                # Изменённые пиксели меняют и результат соседей: обновляемая область шире
+                # на пиксель за проход, а масштабируется область ещё шире на столько же,
+                # чтобы края обновляемой видели своих настоящих соседей
+                margin = 2 * self._passes
+                rect = rect.inflate(margin, margin).clip(source_bounds)
+            screen_rect = pygame.Rect(rect.x * ratio_x, rect.y * ratio_y, rect.width * ratio_x, rect.height * ratio_y)
+            if self.filter == NEAREST and self._direct:
+                self._scale(self.source.subsurface(rect), self.target.subsurface(screen_rect))
+            else:
+                # Масштабируем область с запасом и переносим в окно только её середину
+                margin = 2 * self._passes
+                padded = rect.inflate(margin, margin).clip(source_bounds)
+                padded_screen = pygame.Rect(padded.x * ratio_x, padded.y * ratio_y,
+                                            padded.width * ratio_x, padded.height * ratio_y)
+                self._scale(self.source.subsurface(padded), self._buffer.subsurface(padded_screen))
+                self.target.blit(self._buffer, screen_rect, screen_rect)
+            screen_rects.append(screen_rect)
+        return screen_rects
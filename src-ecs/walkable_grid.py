@@ -0,0 +1,64 @@
+from typing import List, Tuple
+
+# Значения клеток сетки. Всё, что не BLOCKED, проходимо
+BLOCKED = 0
+FLOOR = 1
+STAIRS = 2
+
+
+class WalkableGrid:
+    """Сетка проходимости уровня: одна клетка карты — один байт.
+
+    Строится один раз при генерации карты и хранится в ECS как переменная
+    'walkable_grid'. Движение, поиск пути, спавн врагов и расстановка предметов
+    читают её вместо обхода всех сущностей с TileComponent.
+    Клетки лежат плоским массивом с индексом y * width + x.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        # Увеличивается при каждом изменении клетки — по нему сбрасываются кэши
+        self.version = 0
+        self._cells_cache: dict[int, List[Tuple[int, int]]] = {}
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int) -> int:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return BLOCKED
+
+    def set(self, x: int, y: int, value: int) -> None:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        index = y * self.width + x
+        if self.cells[index] != value:
+            self.cells[index] = value
+            self.version += 1
+            self._cells_cache.clear()
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return self.get(x, y) != BLOCKED
+
+    def walkable_cells(self) -> List[Tuple[int, int]]:
+        """Все проходимые клетки (список кэшируется до следующего изменения сетки)"""
+        return self._collect(None)
+
+    def floor_cells(self) -> List[Tuple[int, int]]:
+        """Клетки обычного пола, без лестниц"""
+        return self._collect(FLOOR)
+
+    def _collect(self, value) -> List[Tuple[int, int]]:
+        key = -1 if value is None else value
+        cells = self._cells_cache.get(key)
+        if cells is None:
+            width = self.width
+            if value is None:
+                cells = [(i % width, i // width) for i, cell in enumerate(self.cells) if cell != BLOCKED]
+            else:
+                cells = [(i % width, i // width) for i, cell in enumerate(self.cells) if cell == value]
+            self._cells_cache[key] = cells
+        return cells